@@ -9,7 +9,24 @@ __version__ = "0.1.0"
 __author__ = "Amirofcodes"
 __license__ = "MIT"
 
-from .core import Environment, ConfigurationManager, DockerManager
+from chimera_stack.utils.lazy import lazy_exports
+
+# Eager: importing the chimera_stack.cli submodule (e.g. via the console
+# script) binds the module to this name, which a lazy lookup would never undo
 from .cli import cli
 
-__all__ = ['Environment', 'ConfigurationManager', 'DockerManager', 'cli']
\ No newline at end of file
+# Submodule providing each public name, imported on first access (PEP 562)
+_LAZY = {
+    'Environment': '.core.environment',
+    'ConfigurationManager': '.core.config',
+    'DockerManager': '.core.docker_manager'
+}
+
+__all__ = [
+    'Environment',
+    'ConfigurationManager',
+    'DockerManager',
+    'cli'
+]
+
+__getattr__, __dir__ = lazy_exports(_LAZY, __name__)
\ No newline at end of file
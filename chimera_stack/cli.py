@@ -9,7 +9,6 @@ import click
 from pathlib import Path
 from typing import Dict, Any
 
-from chimera_stack.core.config import ConfigurationManager
 from chimera_stack.core.environment import Environment
 from chimera_stack.core.docker_manager import DockerManager
 from chimera_stack.core.setup_wizard import SetupWizard
@@ -70,12 +69,14 @@ def init():
               type=click.Choice(['development', 'testing', 'production']),
               default='development',
               help='Environment type')
+@click.option('--nginx-cache', is_flag=True, default=False,
+              help='Cache PHP responses in Nginx (not for personalised pages)')
 def create(project_name: str, language: str, framework: str,
-          webserver: str, database: str, env: str):
+          webserver: str, database: str, env: str, nginx_cache: bool):
     """Create a new development environment using specified options."""
     create_project(project_name=project_name, language=language,
                   framework=framework, webserver=webserver,
-                  database=database, env=env)
+                  database=database, env=env, nginx_cache=nginx_cache)
 
 @cli.command()
 @click.argument('project_name')
@@ -83,12 +84,14 @@ def start(project_name: str):
     """Start an existing development environment."""
     try:
         project_path = Path.cwd() / project_name
-        if not project_path.exists():
-            raise click.ClickException(f"Project {project_name} not found")
 
         click.echo(f"Starting {project_name} environment...")
         docker_manager = DockerManager(project_name, project_path)
-        if docker_manager.start_environment():
+        try:
+            started = docker_manager.start_environment()
+        except FileNotFoundError:
+            raise click.ClickException(f"Project {project_name} not found")
+        if started:
             click.echo(f"✨ Environment {project_name} started successfully!")
         else:
             raise click.ClickException("Failed to start environment")
@@ -102,12 +105,14 @@ def stop(project_name: str):
     """Stop a running development environment."""
     try:
         project_path = Path.cwd() / project_name
-        if not project_path.exists():
-            raise click.ClickException(f"Project {project_name} not found")
 
         click.echo(f"Stopping {project_name} environment...")
         docker_manager = DockerManager(project_name, project_path)
-        if docker_manager.stop_environment():
+        try:
+            stopped = docker_manager.stop_environment()
+        except FileNotFoundError:
+            raise click.ClickException(f"Project {project_name} not found")
+        if stopped:
             click.echo(f"✨ Environment {project_name} stopped successfully!")
         else:
             raise click.ClickException("Failed to stop environment")
@@ -133,8 +138,13 @@ def info():
     click.echo("\nFor more information, visit the repository.")
 
 def create_project(project_name: str, language: str, framework: str,
-                   webserver: str, database: str, env: str):
+                   webserver: str, database: str, env: str,
+                   nginx_cache: bool = False):
     """Common project creation logic used by both init and create commands."""
+    # Deferred: pulls in PyYAML and every service module, which only
+    # project creation needs
+    from chimera_stack.core.config import ConfigurationManager
+
     try:
         project_path = Path.cwd() / project_name
 
@@ -148,6 +158,8 @@ def create_project(project_name: str, language: str, framework: str,
         click.echo(f"  Web Server: {webserver}")
         click.echo(f"  Database:   {database}")
         click.echo(f"  Environment:{env}")
+        if nginx_cache and webserver == 'nginx':
+            click.echo("  Nginx Cache:enabled")
 
         # Initialize environment
         environment = Environment(project_name, project_path)
@@ -163,7 +175,8 @@ def create_project(project_name: str, language: str, framework: str,
             framework=framework,
             webserver=webserver,
             database=database,
-            environment=env
+            environment=env,
+            nginx_cache=nginx_cache
         ):
             raise click.ClickException("Failed to initialize project configuration")
 
@@ -182,18 +195,6 @@ def create_project(project_name: str, language: str, framework: str,
             click.echo(f"Warning: {str(e)}")
             click.echo("Using existing volume...")
 
-        # Clean up empty directories
-        empty_dirs = [
-            project_path / 'docker' / 'database',
-            project_path / 'docker' / 'webserver'
-        ]
-        for dir_path in empty_dirs:
-            if dir_path.exists() and not any(dir_path.iterdir()):
-                try:
-                    dir_path.rmdir()
-                except Exception as e:
-                    print(f"Warning: Could not remove empty directory {dir_path}: {e}")
-
         click.echo(f"\n✨ Project {project_name} created successfully!")
         
         # Generate dynamic project guide based on configuration
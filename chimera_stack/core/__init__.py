@@ -9,15 +9,22 @@ __version__ = "0.1.0"
 __author__ = "Jaouad Bouddehbine"
 __license__ = "MIT"
 
+from chimera_stack.utils.lazy import lazy_exports
 from typing import Dict, List, Optional, Union
-from .environment import Environment
-from .config import ConfigurationManager
-from .docker_manager import DockerManager
-from .setup_wizard import SetupWizard
+
+# Submodule providing each public name, imported on first access (PEP 562)
+_LAZY = {
+    'Environment': '.environment',
+    'ConfigurationManager': '.config',
+    'DockerManager': '.docker_manager',
+    'SetupWizard': '.setup_wizard'
+}
 
 __all__ = [
     "Environment",
     "ConfigurationManager",
     "DockerManager",
     "SetupWizard",
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(_LAZY, __name__)
\ No newline at end of file
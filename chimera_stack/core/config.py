@@ -5,44 +5,57 @@ Handles configuration loading, validation, and management for development enviro
 Supports multiple environment types and framework-specific settings.
 """
 
-import os
+import logging
 import yaml
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 from dataclasses import dataclass
 
-from chimera_stack.services.databases import (
-    MySQLService, PostgreSQLService, MariaDBService
-)
-from chimera_stack.services.webservers import (
-    NginxService, ApacheService
-)
-from chimera_stack.frameworks.php import (
-    LaravelFramework, SymfonyFramework, VanillaPHPFramework
-)
-from chimera_stack.frameworks.python import (
-    DjangoFramework, FlaskFramework, VanillaPythonFramework
-)
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+from chimera_stack import frameworks
+from chimera_stack.services import databases, webservers
+
+_LOG = logging.getLogger(__name__)
+
+# Keys written to .env, in order, under each section heading
+_PHP_ENV_KEYS = ('PHP_DISPLAY_ERRORS', 'PHP_ERROR_REPORTING', 'PHP_MEMORY_LIMIT',
+                 'PHP_MAX_EXECUTION_TIME', 'PHP_POST_MAX_SIZE', 'PHP_UPLOAD_MAX_FILESIZE')
+_DB_ENV_KEYS = ('DB_CONNECTION', 'DB_HOST', 'DB_PORT', 'DB_DATABASE',
+                'DB_USERNAME', 'DB_PASSWORD', 'DB_ROOT_PASSWORD')
 
 class ConfigurationManager:
     """Manages configuration for development environments."""
 
-    DEFAULT_CONFIG = {
+    # Read-only template; __init__ gives every instance its own containers
+    DEFAULT_CONFIG = MappingProxyType({
         'version': '3.8',
-        'services': {},
-        'networks': {
-            'app_network': {
+        'services': MappingProxyType({}),
+        'networks': MappingProxyType({
+            'app_network': MappingProxyType({
                 'driver': 'bridge'
-            }
-        },
-        'volumes': {}
-    }
+            })
+        }),
+        'volumes': MappingProxyType({})
+    })
 
     def __init__(self, project_name: str, base_path: Path):
         self.project_name = project_name
         self.base_path = base_path
         self.config_path = base_path / 'config'
-        self.config: Dict[str, Any] = self.DEFAULT_CONFIG.copy()
+        self.config: Dict[str, Any] = {
+            **self.DEFAULT_CONFIG,
+            'services': {},
+            'networks': {
+                name: dict(network)
+                for name, network in self.DEFAULT_CONFIG['networks'].items()
+            },
+            'volumes': {}
+        }
         self.environment_vars: Dict[str, str] = {
             # PHP Configuration
             'PHP_DISPLAY_ERRORS': '1',
@@ -67,9 +80,13 @@ class ConfigurationManager:
         framework: str,
         webserver: str,
         database: str,
-        environment: str
+        environment: str,
+        nginx_cache: bool = False
     ) -> bool:
-        """Initialize project configuration and create necessary files."""
+        """Initialize project configuration and create necessary files.
+
+        nginx_cache enables the Nginx FastCGI response cache for PHP output.
+        """
         try:
             # Create configuration directory
             self.config_path.mkdir(exist_ok=True, parents=True)
@@ -84,7 +101,7 @@ class ConfigurationManager:
             })
 
             # Initialize service configurations
-            self._initialize_services(language, framework, webserver, database)
+            self._initialize_services(language, framework, webserver, database, nginx_cache)
 
             # Normalize configurations
             self._normalize_volume_config()
@@ -98,7 +115,7 @@ class ConfigurationManager:
 
             return True
         except Exception as e:
-            print(f"Error initializing config: {e}")
+            _LOG.error("Error initializing config: %s", e)
             return False
 
     def _normalize_volume_config(self) -> None:
@@ -165,7 +182,8 @@ class ConfigurationManager:
         }
 
     def _initialize_services(self, language: str, framework: str,
-                           webserver: str, database: str) -> None:
+                           webserver: str, database: str,
+                           nginx_cache: bool = False) -> None:
         """Initialize service configurations based on selected options."""
         # Initialize database service
         db_service = self._get_database_service(database)
@@ -173,7 +191,7 @@ class ConfigurationManager:
             self._create_database_config(db_service)
 
         # Initialize web server service
-        web_service = self._get_webserver_service(webserver)
+        web_service = self._get_webserver_service(webserver, nginx_cache)
         if web_service:
             self._create_webserver_config(web_service)
 
@@ -184,71 +202,71 @@ class ConfigurationManager:
 
     def _get_database_service(self, database: str):
         """Get appropriate database service instance."""
-        services = {
-            'mysql': MySQLService,
-            'postgresql': PostgreSQLService,
-            'mariadb': MariaDBService
+        # Class names only: the databases package imports just the chosen one
+        class_names = {
+            'mysql': 'MySQLService',
+            'postgresql': 'PostgreSQLService',
+            'mariadb': 'MariaDBService'
         }
-        service_class = services.get(database)
-        if service_class:
+        if database in class_names:
+            service_class = getattr(databases, class_names[database])
             return service_class(self.project_name, self.base_path)
         return None
 
-    def _get_webserver_service(self, webserver: str):
+    def _get_webserver_service(self, webserver: str, nginx_cache: bool = False):
         """Get appropriate web server service instance."""
-        services = {
-            'nginx': NginxService,
-            'apache': ApacheService
+        # Class names only: the webservers package imports just the chosen one
+        class_names = {
+            'nginx': 'NginxService',
+            'apache': 'ApacheService'
         }
-        service_class = services.get(webserver)
-        if service_class:
+        if webserver in class_names:
+            service_class = getattr(webservers, class_names[webserver])
+            if webserver == 'nginx':
+                return service_class(self.project_name, self.base_path,
+                                     cache_enabled=nginx_cache)
             return service_class(self.project_name, self.base_path)
         return None
 
     def _get_framework_service(self, language: str, framework: str):
         """Get appropriate framework service instance."""
-        frameworks = {
+        # Class names only: the frameworks package imports just the chosen one
+        class_names = {
             'php': {
-                'laravel': LaravelFramework,
-                'symfony': SymfonyFramework,
-                'none': VanillaPHPFramework
+                'laravel': 'LaravelFramework',
+                'symfony': 'SymfonyFramework',
+                'none': 'VanillaPHPFramework'
             },
             'python': {
-                'django': DjangoFramework,
-                'flask': FlaskFramework,
-                'none': VanillaPythonFramework
+                'django': 'DjangoFramework',
+                'flask': 'FlaskFramework',
+                'none': 'VanillaPythonFramework'
             }
         }
-        if language in frameworks and framework in frameworks[language]:
-            framework_class = frameworks[language][framework]
+        if language in class_names and framework in class_names[language]:
+            framework_class = getattr(frameworks, class_names[language][framework])
             return framework_class(self.project_name, self.base_path)
         return None
 
     def _create_database_config(self, service) -> None:
         """Create database configuration files."""
-        docker_path = self.base_path / 'docker' / 'database'
-        docker_path.mkdir(parents=True, exist_ok=True)
-        
-        # Generate service configuration
+        # Build the compose service definition; this touches no files
         config = service.get_docker_config()
         self.config['services'].update(config.get('services', {}))
         
         if 'volumes' in config:
             self.config['volumes'].update(config.get('volumes', {}))
         
-        # Generate configuration files
+        # Write configuration files, the only step that touches the filesystem
         service.generate_server_config()
 
     def _create_webserver_config(self, service) -> None:
         """Create web server configuration files."""
-        docker_path = self.base_path / 'docker' / 'webserver'
-        docker_path.mkdir(parents=True, exist_ok=True)
-        
-        # Generate service configuration
+        # Build the compose service definition; this touches no files
         config = service.get_docker_config()
         self.config['services'].update(config.get('services', {}))
         
-        # Generate configuration files
+        # Write configuration files, the only step that touches the filesystem
         service.generate_server_config()
 
     def _create_framework_config(self, service) -> None:
@@ -281,53 +299,47 @@ class ConfigurationManager:
                 del compose_config[key]
 
         docker_compose_path = self.base_path / 'docker-compose.yml'
-        with open(docker_compose_path, 'w') as f:
-            yaml.dump(compose_config, f, sort_keys=False)
+        with open(docker_compose_path, 'wb') as f:
+            yaml.dump(compose_config, f, Dumper=_Dumper, encoding='utf-8', sort_keys=False)
 
     def _save_environment_file(self) -> None:
         """Save environment variables file."""
         env_path = self.base_path / '.env'
-        env_content = []
-        
-        # Add PHP environment variables
-        env_content.append("# PHP Configuration")
-        for key in ['PHP_DISPLAY_ERRORS', 'PHP_ERROR_REPORTING', 'PHP_MEMORY_LIMIT',
-                   'PHP_MAX_EXECUTION_TIME', 'PHP_POST_MAX_SIZE', 'PHP_UPLOAD_MAX_FILESIZE']:
-            env_content.append(f"{key}={self.environment_vars[key]}")
-        
-        # Add database environment variables
+        env = self.environment_vars
+        env_content = ["# PHP Configuration"]
+        env_content.extend(f"{key}={env[key]}" for key in _PHP_ENV_KEYS)
         env_content.append("\n# Database Configuration")
-        for key in ['DB_CONNECTION', 'DB_HOST', 'DB_PORT', 'DB_DATABASE',
-                   'DB_USERNAME', 'DB_PASSWORD', 'DB_ROOT_PASSWORD']:
-            env_content.append(f"{key}={self.environment_vars[key]}")
-        
-        with open(env_path, 'w') as f:
-            f.write('\n'.join(env_content))
+        env_content.extend(f"{key}={env[key]}" for key in _DB_ENV_KEYS)
+
+        env_path.write_bytes('\n'.join(env_content).encode('utf-8'))
 
     def load_config(self, environment: str = 'development') -> bool:
         """Load configuration for specified environment."""
         try:
             config_file = self.config_path / f'{environment}.yaml'
-            
-            if config_file.exists():
-                with open(config_file, 'r') as f:
-                    env_config = yaml.safe_load(f)
-                self.config.update(env_config)
-            
+
+            # A missing file is not an error; open directly instead of stat + open
+            try:
+                with open(config_file, 'rb') as f:
+                    env_config = yaml.load(f, Loader=_Loader)
+            except FileNotFoundError:
+                return True
+            self.config.update(env_config)
+
             return True
         except Exception as e:
-            print(f"Error loading configuration: {e}")
+            _LOG.error("Error loading configuration: %s", e)
             return False
 
     def save_config(self, environment: str = 'development') -> bool:
         """Save current configuration to file."""
         try:
             config_file = self.config_path / f'{environment}.yaml'
-            with open(config_file, 'w') as f:
-                yaml.safe_dump(self.config, f)
+            with open(config_file, 'wb') as f:
+                yaml.dump(self.config, f, Dumper=_Dumper, encoding='utf-8')
             return True
         except Exception as e:
-            print(f"Error saving configuration: {e}")
+            _LOG.error("Error saving configuration: %s", e)
             return False
     
     def _save_env_config(self, environment: str) -> None:
@@ -348,8 +360,8 @@ class ConfigurationManager:
         }
 
         config_file = self.config_path / f'{environment}.yaml'
-        with open(config_file, 'w') as f:
-            yaml.safe_dump(env_config, f, sort_keys=False)
+        with open(config_file, 'wb') as f:
+            yaml.dump(env_config, f, Dumper=_Dumper, encoding='utf-8', sort_keys=False)
 
     def _clean_service_config(self, config: Dict) -> Dict:
         """Clean service configuration for environment file."""
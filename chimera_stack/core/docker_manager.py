@@ -5,10 +5,86 @@ Handles Docker operations including container management and volume handling
 for development environments.
 """
 
+import logging
+import os
+import shutil
+import socket
 import subprocess
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
+_LOG = logging.getLogger(__name__)
+
+DOCKER_INFO_TIMEOUT = 30
+DOCKER_SOCKET_TIMEOUT = 1
+
+# Records a successful check keyed on the docker binary's mtime, so later CLI
+# runs replace `docker info` with a connect to the daemon socket until Docker
+# is reinstalled or upgraded.
+DOCKER_OK_MARKER = Path.home() / '.cache' / 'chimera_stack' / 'docker_ok'
+
+def _docker_binary_stamp() -> Optional[str]:
+    """Return the docker binary's mtime as a marker key, if it is installed."""
+    docker_bin = shutil.which('docker')
+    if docker_bin is None:
+        return None
+    try:
+        return str(os.stat(docker_bin).st_mtime_ns)
+    except OSError:
+        return None
+
+def _write_marker(stamp: str) -> None:
+    """Persist a verified stamp, creating the cache directory only if missing."""
+    try:
+        try:
+            DOCKER_OK_MARKER.write_text(stamp)
+        except FileNotFoundError:
+            DOCKER_OK_MARKER.parent.mkdir(parents=True, exist_ok=True)
+            DOCKER_OK_MARKER.write_text(stamp)
+    except OSError as e:
+        _LOG.debug("Could not cache Docker verification: %s", e)
+
+def _daemon_socket_accepts() -> bool:
+    """Check that a local Docker daemon is listening on its unix socket.
+
+    Returns:
+        bool: True if the socket accepted a connection, False if it did not or
+            Docker is not reached through a local unix socket
+    """
+    host = os.environ.get('DOCKER_HOST', 'unix:///var/run/docker.sock')
+    if not host.startswith('unix://') or not hasattr(socket, 'AF_UNIX'):
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(DOCKER_SOCKET_TIMEOUT)
+        try:
+            sock.connect(host[len('unix://'):])
+        except OSError:
+            return False
+    return True
+
+@lru_cache(maxsize=None)
+def _docker_available() -> bool:
+    """Check the Docker daemon once per process and remember the result."""
+    stamp = _docker_binary_stamp()
+    if stamp is None:
+        return False
+    try:
+        cached = DOCKER_OK_MARKER.read_text() == stamp
+    except OSError:
+        cached = False
+    # The marker only vouches for the installation; a connect to the daemon
+    # socket confirms it is running without the cost of `docker info`
+    if cached and _daemon_socket_accepts():
+        return True
+    try:
+        subprocess.run(['docker', 'info'], capture_output=True, check=True,
+                       timeout=DOCKER_INFO_TIMEOUT)
+    except (subprocess.CalledProcessError, subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+    _write_marker(stamp)
+    return True
+
 class DockerManager:
     """Manages Docker operations for development environments."""
 
@@ -19,11 +95,7 @@ class DockerManager:
 
     def verify_docker_installation(self) -> bool:
         """Verify Docker is installed and running."""
-        try:
-            subprocess.run(['docker', 'info'], capture_output=True, check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
+        return _docker_available()
 
     def create_volume(self, volume_name: Optional[str] = None) -> bool:
         """Create a Docker volume for persistent data."""
@@ -38,11 +110,15 @@ class DockerManager:
             self.volumes[name] = name
             return True
         except subprocess.CalledProcessError as e:
-            print(f"Error creating volume: {e.stderr}")
+            _LOG.error("Error creating volume: %s", e.stderr)
             return False
 
     def start_environment(self) -> bool:
-        """Start the Docker environment using docker-compose."""
+        """Start the Docker environment using docker-compose.
+
+        Raises:
+            FileNotFoundError: If the project directory does not exist
+        """
         try:
             result = subprocess.run(
                 ['docker-compose', 'up', '-d'],
@@ -53,14 +129,23 @@ class DockerManager:
             )
             return True
         except subprocess.CalledProcessError as e:
-            print(f"Error starting environment: {e.stderr}")
+            _LOG.error("Error starting environment: %s", e.stderr)
+            return False
+        except FileNotFoundError as e:
+            if e.filename is not None and os.fspath(e.filename) == os.fspath(self.base_path):
+                raise  # Missing project directory, reported by the caller
+            _LOG.error("Error starting environment: %s", e)
             return False
         except Exception as e:
-            print(f"Error starting environment: {e}")
+            _LOG.error("Error starting environment: %s", e)
             return False
 
     def stop_environment(self) -> bool:
-        """Stop the Docker environment using docker-compose."""
+        """Stop the Docker environment using docker-compose.
+
+        Raises:
+            FileNotFoundError: If the project directory does not exist
+        """
         try:
             result = subprocess.run(
                 ['docker-compose', 'down'],
@@ -71,10 +156,15 @@ class DockerManager:
             )
             return True
         except subprocess.CalledProcessError as e:
-            print(f"Error stopping environment: {e.stderr}")
+            _LOG.error("Error stopping environment: %s", e.stderr)
+            return False
+        except FileNotFoundError as e:
+            if e.filename is not None and os.fspath(e.filename) == os.fspath(self.base_path):
+                raise  # Missing project directory, reported by the caller
+            _LOG.error("Error stopping environment: %s", e)
             return False
         except Exception as e:
-            print(f"Error stopping environment: {e}")
+            _LOG.error("Error stopping environment: %s", e)
             return False
 
     def cleanup(self) -> bool:
@@ -88,5 +178,5 @@ class DockerManager:
                 )
             return True
         except subprocess.CalledProcessError as e:
-            print(f"Error during cleanup: {e.stderr}")
+            _LOG.error("Error during cleanup: %s", e.stderr)
             return False
\ No newline at end of file
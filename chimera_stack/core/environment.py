@@ -4,11 +4,42 @@ Environment Management Module
 Handles the creation and configuration of development environments.
 """
 
+import logging
 import os
 import shutil
 from typing import Dict, Optional
 from pathlib import Path
 
+_LOG = logging.getLogger(__name__)
+
+_GITIGNORE = b"""
+# Environment files
+.env
+*.env
+
+# Dependencies
+/vendor/
+__pycache__/
+*.py[cod]
+*$py.class
+
+# IDE files
+.idea/
+.vscode/
+*.sublime-*
+
+# OS files
+.DS_Store
+Thumbs.db
+
+# Logs
+*.log
+
+# Build artifacts
+/build/
+/dist/
+""".strip()
+
 
 class Environment:
     """Manages development environment setup and configuration."""
@@ -70,7 +101,7 @@ class Environment:
                 path.mkdir(parents=True, exist_ok=True)
             return True
         except Exception as e:
-            print(f"Error creating directory {path}: {e}")
+            _LOG.error("Error creating directory %s: %s", path, e)
             return False
 
     def setup(self) -> bool:
@@ -101,51 +132,24 @@ class Environment:
 
             return True
         except Exception as e:
-            print(f"Error setting up environment: {e}")
+            _LOG.error("Error setting up environment: %s", e)
             self.cleanup()
             return False
 
     def _create_initial_files(self) -> None:
         """Create initial configuration files for the project."""
-        # Create empty docker-compose.yml
-        docker_compose = self.path / 'docker-compose.yml'
-        docker_compose.touch(exist_ok=True)
-
-        # Create empty .env file
-        env_file = self.path / '.env'
-        env_file.touch(exist_ok=True)
-
-        # Create .gitignore if it doesn't exist
-        gitignore = self.path / '.gitignore'
-        if not gitignore.exists():
-            gitignore_content = """
-# Environment files
-.env
-*.env
-
-# Dependencies
-/vendor/
-__pycache__/
-*.py[cod]
-*$py.class
-
-# IDE files
-.idea/
-.vscode/
-*.sublime-*
+        # Create empty docker-compose.yml and .env files. A bare O_CREAT open
+        # skips the utime attempt Path.touch makes before creating the file.
+        for name in ('docker-compose.yml', '.env'):
+            os.close(os.open(self.path / name, os.O_WRONLY | os.O_CREAT, 0o644))
 
-# OS files
-.DS_Store
-Thumbs.db
-
-# Logs
-*.log
-
-# Build artifacts
-/build/
-/dist/
-"""
-            gitignore.write_text(gitignore_content.strip())
+        # Create .gitignore if it doesn't exist; exclusive create keeps an
+        # existing one without a separate stat
+        try:
+            with open(self.path / '.gitignore', 'xb') as f:
+                f.write(_GITIGNORE)
+        except FileExistsError:
+            pass
 
     def cleanup(self) -> bool:
         """
@@ -159,5 +163,5 @@ Thumbs.db
                 shutil.rmtree(self.path)
             return True
         except Exception as e:
-            print(f"Error cleaning up environment: {e}")
+            _LOG.error("Error cleaning up environment: %s", e)
             return False
\ No newline at end of file
@@ -5,8 +5,17 @@ Framework Implementations
 Provides framework-specific implementations for PHP and Python projects.
 """
 
-from .php import LaravelFramework, SymfonyFramework, VanillaPHPFramework
-from .python import DjangoFramework, FlaskFramework, VanillaPythonFramework
+from chimera_stack.utils.lazy import lazy_exports
+
+# Submodule providing each public name, imported on first access (PEP 562)
+_LAZY = {
+    'LaravelFramework': '.php.laravel',
+    'SymfonyFramework': '.php.symfony',
+    'VanillaPHPFramework': '.php.vanilla',
+    'DjangoFramework': '.python.django',
+    'FlaskFramework': '.python.flask',
+    'VanillaPythonFramework': '.python.vanilla'
+}
 
 __all__ = [
     'LaravelFramework',
@@ -15,4 +24,6 @@ __all__ = [
     'DjangoFramework',
     'FlaskFramework',
     'VanillaPythonFramework'
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(_LAZY, __name__)
\ No newline at end of file
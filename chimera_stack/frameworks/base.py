@@ -5,9 +5,29 @@ Defines the contract that all framework implementations must follow,
 ensuring consistent behavior across different programming languages and frameworks.
 """
 
+import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Mapping, Set, Tuple, Union
+
+from chimera_stack.utils.fs import ensure_dir, write_many
+
+_LOG = logging.getLogger(__name__)
+
+@lru_cache(maxsize=32)
+def render_template(template: str, **fields: str) -> bytes:
+    """
+    Render a file template once per distinct set of field values.
+
+    Args:
+        template: str.format template
+        fields: Values substituted into the template
+
+    Returns:
+        bytes: Stripped, UTF-8 encoded file contents
+    """
+    return template.format_map(fields).strip().encode('utf-8')
 
 
 class BaseFramework(ABC):
@@ -27,6 +47,7 @@ class BaseFramework(ABC):
         self.docker_path = base_path / 'docker'
         self.config_path = base_path / 'config'
         self.docker_requirements: Dict[str, Dict] = {}
+        self._ensured_dirs: Set[str] = set()
 
     @abstractmethod
     def initialize_project(self) -> bool:
@@ -49,12 +70,12 @@ class BaseFramework(ABC):
         pass
 
     @abstractmethod
-    def get_default_ports(self) -> Dict[str, int]:
+    def get_default_ports(self) -> Mapping[str, int]:
         """
         Return default ports used by the framework.
 
         Returns:
-            Dict[str, int]: Dictionary of service names to port numbers
+            Mapping[str, int]: Read-only mapping of service names to port numbers
         """
         pass
 
@@ -83,9 +104,22 @@ class BaseFramework(ABC):
                 path.mkdir(parents=True, exist_ok=True)
             return True
         except Exception as e:
-            print(f"Error creating directory {path}: {e}")
+            _LOG.error("Error creating directory %s: %s", path, e)
             return False
 
+    def _ensure_dir(self, path: Union[str, Path]) -> None:
+        """Create a directory (and parents) once per instance."""
+        ensure_dir(path, self._ensured_dirs)
+
+    def _write_many(self, files: List[Tuple[Union[str, Path], bytes]]) -> None:
+        """
+        Write a batch of pre-encoded files in a single pass.
+
+        Args:
+            files: (path, content) pairs to write
+        """
+        write_many(files, self._ensured_dirs)
+
     def get_project_root(self) -> Path:
         """
         Get the project's root directory.
@@ -5,12 +5,19 @@ Provides framework-specific implementations for PHP projects including Laravel,
 Symfony, and vanilla PHP configurations.
 """
 
-from .laravel import LaravelFramework
-from .symfony import SymfonyFramework
-from .vanilla import VanillaPHPFramework
+from chimera_stack.utils.lazy import lazy_exports
+
+# Submodule providing each public name, imported on first access (PEP 562)
+_LAZY = {
+    'LaravelFramework': '.laravel',
+    'SymfonyFramework': '.symfony',
+    'VanillaPHPFramework': '.vanilla'
+}
 
 __all__ = [
     'LaravelFramework',
     'SymfonyFramework',
     'VanillaPHPFramework'
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(_LAZY, __name__)
\ No newline at end of file
@@ -5,12 +5,16 @@ Provides common functionality for PHP-based frameworks.
 """
 
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from chimera_stack.frameworks.base import BaseFramework
 
 class BasePHPFramework(BaseFramework):
     """Base class for PHP frameworks."""
 
+    # Read-only: shared by every instance
+    _DEFAULT_PORTS: Mapping[str, int] = MappingProxyType({'web': 8080, 'php-fpm': 9000, 'database': 3306})
+
     def __init__(self, project_name: str, base_path: Path):
         super().__init__(project_name, base_path)
         self.docker_requirements = {
@@ -20,12 +24,9 @@ class BasePHPFramework(BaseFramework):
             }
         }
 
-    def get_default_ports(self) -> Dict[str, int]:
-        return {
-            'web': 8080,
-            'php-fpm': 9000,
-            'database': 3306
-        }
+    def get_default_ports(self) -> Mapping[str, int]:
+        """Return default host ports for development."""
+        return self._DEFAULT_PORTS
 
     def configure_docker(self) -> Dict[str, Any]:
         """Generate base PHP Docker configuration."""
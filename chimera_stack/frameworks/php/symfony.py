@@ -5,128 +5,92 @@ Handles Docker environment setup for Symfony projects, focusing on container con
 and environment preparation without interfering with Symfony's structure.
 """
 
+import logging
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from chimera_stack.frameworks.php.base_php import BasePHPFramework
 
-class SymfonyFramework(BasePHPFramework):
-    """Symfony framework implementation focusing on Docker environment setup."""
+_LOG = logging.getLogger(__name__)
 
-    def __init__(self, project_name: str, base_path: Path):
-        super().__init__(project_name, base_path)
-        self.docker_requirements.update({
-            'php': {
-                'image': 'php:8.3-fpm',
-                'platform': 'linux/arm64',
-                'extensions': [
-                    'pdo',
-                    'pdo_mysql',
-                    'zip',
-                    'intl',
-                    'opcache'
-                ]
-            }
-        })
+_ENV_FILE = b"""
+###> symfony/framework-bundle ###
+APP_ENV=dev
+APP_SECRET=changeThisToASecureSecret
+###< symfony/framework-bundle ###
 
-    def initialize_project(self) -> bool:
-        """Initialize Docker environment for Symfony."""
-        try:
-            # Create only Docker-related directories and files
-            docker_path = self.base_path / 'docker'
-            docker_path.mkdir(exist_ok=True, parents=True)
+###> doctrine/doctrine-bundle ###
+DATABASE_URL="mysql://${MYSQL_USER}:${MYSQL_PASSWORD}@db:3306/${MYSQL_DATABASE}"
+###< doctrine/doctrine-bundle ###
 
-            # Create Docker configurations
-            self._create_docker_configs()
-            
-            return True
-        except Exception as e:
-            print(f"Error initializing Docker environment: {e}")
-            return False
+REDIS_URL=redis://redis:6379
+""".strip()
 
-    def configure_docker(self) -> Dict[str, Any]:
-        """Generate Docker Compose configuration for Symfony."""
-        return {
-            'services': {
-                'app': {
-                    'build': {
-                        'context': '.',
-                        'dockerfile': 'Dockerfile'
-                    },
-                    'container_name': f"{self.project_name}_app",
-                    'volumes': [
-                        '.:/var/www'
-                    ],
-                    'depends_on': [
-                        'db',
-                        'redis'
-                    ]
-                },
-                'nginx': {
-                    'image': 'nginx:alpine',
-                    'container_name': f"{self.project_name}_nginx",
-                    'ports': [
-                        f"{self.get_default_ports()['web']}:8000"
-                    ],
-                    'volumes': [
-                        '.:/var/www',
-                        './docker/nginx/default.conf:/etc/nginx/conf.d/default.conf'
-                    ],
-                    'depends_on': [
-                        'app'
-                    ]
-                },
-                'db': {
-                    'image': 'mysql:8.0',
-                    'container_name': f"{self.project_name}_db",
-                    'platform': 'linux/arm64',
-                    'environment': {
-                        'MYSQL_ROOT_PASSWORD': '${MYSQL_ROOT_PASSWORD}',
-                        'MYSQL_DATABASE': '${MYSQL_DATABASE}',
-                        'MYSQL_USER': '${MYSQL_USER}',
-                        'MYSQL_PASSWORD': '${MYSQL_PASSWORD}'
-                    },
-                    'ports': [
-                        f"{self.get_default_ports()['database']}:3306"
-                    ],
-                    'volumes': [
-                        'db_data:/var/lib/mysql'
-                    ]
-                },
-                'redis': {
-                    'image': 'redis:alpine',
-                    'container_name': f"{self.project_name}_redis",
-                    'platform': 'linux/arm64',
-                    'ports': [
-                        f"{self.get_default_ports()['redis']}:6379"
-                    ]
-                }
-            },
-            'volumes': {
-                'db_data': None
-            }
-        }
+_ENV_DIST_FILE = b"""
+MYSQL_ROOT_PASSWORD=root_password
+MYSQL_DATABASE=mydb
+MYSQL_USER=db_user
+MYSQL_PASSWORD=db_password
+""".strip()
 
-    def get_default_ports(self) -> Dict[str, int]:
-        """Return default ports for Symfony development."""
-        return {
-            'web': 8000,
-            'database': 3306,
-            'redis': 6379
-        }
+# Static compose service skeletons, shallow-copied per call. The None slots are
+# overwritten per project, which keeps them in place in the emitted YAML.
+_APP_SERVICE = {
+    'build': {
+        'context': '.',
+        'dockerfile': 'Dockerfile'
+    },
+    'container_name': None,
+    'volumes': [
+        '.:/var/www'
+    ],
+    'depends_on': [
+        'db',
+        'redis'
+    ]
+}
 
-    def setup_development_environment(self) -> bool:
-        """Set up development environment configurations."""
-        try:
-            self._create_env_file()
-            return True
-        except Exception as e:
-            print(f"Error setting up environment: {e}")
-            return False
+_NGINX_SERVICE = {
+    'image': 'nginx:alpine',
+    'container_name': None,
+    'ports': None,
+    'volumes': [
+        '.:/var/www',
+        './docker/nginx/default.conf:/etc/nginx/conf.d/default.conf'
+    ],
+    'depends_on': [
+        'app'
+    ]
+}
 
-    def _create_docker_configs(self) -> None:
-        """Create necessary Docker configuration files."""
-        # Create Dockerfile
-        dockerfile_content = """
+_DB_SERVICE = {
+    'image': 'mysql:8.0',
+    'container_name': None,
+    'platform': 'linux/arm64',
+    'environment': {
+        'MYSQL_ROOT_PASSWORD': '${MYSQL_ROOT_PASSWORD}',
+        'MYSQL_DATABASE': '${MYSQL_DATABASE}',
+        'MYSQL_USER': '${MYSQL_USER}',
+        'MYSQL_PASSWORD': '${MYSQL_PASSWORD}'
+    },
+    'ports': None,
+    'volumes': [
+        'db_data:/var/lib/mysql'
+    ]
+}
+
+_REDIS_SERVICE = {
+    'image': 'redis:alpine',
+    'container_name': None,
+    'platform': 'linux/arm64',
+    'ports': None
+}
+
+_VOLUMES = {
+    'db_data': None
+}
+
+_DOCKERFILE = b"""
 FROM --platform=linux/arm64 php:8.3-fpm
 
 # Install system dependencies
@@ -152,14 +116,16 @@ RUN composer install
 
 # Set permissions
 RUN chown -R www-data:www-data var
-"""
-        (self.base_path / 'Dockerfile').write_text(dockerfile_content.strip())
+""".strip()
+
+_NGINX_CONF = b"""
+upstream php_fpm {
+    server app:9000;
+    keepalive 32;
+    keepalive_requests 1000;
+    keepalive_timeout 60s;
+}
 
-        # Create Nginx configuration
-        nginx_path = self.base_path / 'docker' / 'nginx'
-        nginx_path.mkdir(exist_ok=True, parents=True)
-        
-        nginx_config = """
 server {
     listen 8000;
     server_name localhost;
@@ -170,7 +136,8 @@ server {
     }
 
     location ~ ^/index\\.php(/|$) {
-        fastcgi_pass app:9000;
+        fastcgi_pass php_fpm;
+        fastcgi_keep_conn on;
         fastcgi_split_path_info ^(.+\\.php)(/.*)$;
         include fastcgi_params;
         fastcgi_param SCRIPT_FILENAME $document_root$fastcgi_script_name;
@@ -182,32 +149,108 @@ server {
         return 404;
     }
 
+    # Serve existing static assets directly and zero-copy; anything missing
+    # still falls through to the front controller
+    location ~* \\.(?:css|js|jpg|jpeg|gif|png|ico|svg|woff2?|ttf|eot|webp|map)$ {
+        try_files $uri /index.php$is_args$args;
+        gzip_static on;
+        sendfile on;
+        tcp_nopush on;
+        open_file_cache max=10000 inactive=60s;
+        open_file_cache_valid 10s;
+        open_file_cache_min_uses 2;
+        expires 30d;
+        access_log off;
+        add_header Cache-Control "public";
+    }
+
     error_log /var/log/nginx/project_error.log;
     access_log /var/log/nginx/project_access.log;
 }
-"""
-        (nginx_path / 'default.conf').write_text(nginx_config.strip())
+""".strip()
 
-    def _create_env_file(self) -> None:
-        """Create sample .env file with development settings."""
-        env_content = f"""
-###> symfony/framework-bundle ###
-APP_ENV=dev
-APP_SECRET=changeThisToASecureSecret
-###< symfony/framework-bundle ###
+class SymfonyFramework(BasePHPFramework):
+    """Symfony framework implementation focusing on Docker environment setup."""
 
-###> doctrine/doctrine-bundle ###
-DATABASE_URL="mysql://${{MYSQL_USER}}:${{MYSQL_PASSWORD}}@db:3306/${{MYSQL_DATABASE}}"
-###< doctrine/doctrine-bundle ###
+    # Read-only: shared by every instance
+    _DEFAULT_PORTS: Mapping[str, int] = MappingProxyType({'web': 8000, 'database': 3306, 'redis': 6379})
 
-REDIS_URL=redis://redis:6379
-"""
-        (self.base_path / '.env').write_text(env_content.strip())
+    def __init__(self, project_name: str, base_path: Path):
+        super().__init__(project_name, base_path)
+        self.docker_requirements.update({
+            'php': {
+                'image': 'php:8.3-fpm',
+                'platform': 'linux/arm64',
+                'extensions': [
+                    'pdo',
+                    'pdo_mysql',
+                    'zip',
+                    'intl',
+                    'opcache'
+                ]
+            }
+        })
 
-        env_dist_content = """
-MYSQL_ROOT_PASSWORD=root_password
-MYSQL_DATABASE=mydb
-MYSQL_USER=db_user
-MYSQL_PASSWORD=db_password
-"""
-        (self.base_path / '.env.dist').write_text(env_dist_content.strip())
\ No newline at end of file
+    def initialize_project(self) -> bool:
+        """Initialize Docker environment for Symfony."""
+        try:
+            # Create only Docker-related directories and files
+            docker_path = self.base_path / 'docker'
+            docker_path.mkdir(exist_ok=True, parents=True)
+
+            # Create Docker configurations
+            self._create_docker_configs()
+            
+            return True
+        except Exception as e:
+            _LOG.error("Error initializing Docker environment: %s", e)
+            return False
+
+    def configure_docker(self) -> Dict[str, Any]:
+        """Generate Docker Compose configuration for Symfony."""
+        name = self.project_name
+        ports = self.get_default_ports()
+        return {
+            'services': {
+                'app': {**_APP_SERVICE, 'container_name': f"{name}_app"},
+                'nginx': {
+                    **_NGINX_SERVICE,
+                    'container_name': f"{name}_nginx",
+                    'ports': [f"{ports['web']}:8000"]
+                },
+                'db': {
+                    **_DB_SERVICE,
+                    'container_name': f"{name}_db",
+                    'ports': [f"{ports['database']}:3306"]
+                },
+                'redis': {
+                    **_REDIS_SERVICE,
+                    'container_name': f"{name}_redis",
+                    'ports': [f"{ports['redis']}:6379"]
+                }
+            },
+            'volumes': {**_VOLUMES}
+        }
+
+    def setup_development_environment(self) -> bool:
+        """Set up development environment configurations."""
+        try:
+            self._create_env_file()
+            return True
+        except Exception as e:
+            _LOG.error("Error setting up environment: %s", e)
+            return False
+
+    def _create_docker_configs(self) -> None:
+        """Create necessary Docker configuration files."""
+        self._write_many([
+            (self.base_path / 'Dockerfile', _DOCKERFILE),
+            (self.base_path / 'docker' / 'nginx' / 'default.conf', _NGINX_CONF)
+        ])
+
+    def _create_env_file(self) -> None:
+        """Create sample .env file with development settings."""
+        self._write_many([
+            (self.base_path / '.env', _ENV_FILE),
+            (self.base_path / '.env.dist', _ENV_DIST_FILE)
+        ])
\ No newline at end of file
@@ -4,65 +4,273 @@ Vanilla PHP Implementation
 Provides a clean, framework-free PHP development environment using Docker.
 """
 
+import logging
+import os
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+from chimera_stack.frameworks.base import render_template
 from chimera_stack.frameworks.php.base_php import BasePHPFramework
 
-class VanillaPHPFramework(BasePHPFramework):
-    def __init__(self, project_name: str, base_path: Path):
-        super().__init__(project_name, base_path)
-        self.docker_requirements.update({
-            'php': {
-                'image': 'php:8.2-fpm',
-                'system_packages': [
-                    'git',
-                    'zip',
-                    'unzip',
-                    'libpng-dev',
-                    'libonig-dev',
-                    'libzip-dev'
-                ],
-                'extensions': {
-                    'pdo': None,
-                    'pdo_mysql': None,
-                    'mbstring': None,
-                    'zip': None,
-                    'exif': None,
-                    'gd': {'configure': True}
-                }
-            }
-        })
+_LOG = logging.getLogger(__name__)
 
-    def initialize_project(self) -> bool:
-        """Initialize a minimal PHP project structure."""
-        try:
-            # Define and create only directories that will be used
-            public_path = self.base_path / 'public'
-            src_path = self.base_path / 'src'
-            pages_path = src_path / 'pages'
+_DOCKERFILE_TEMPLATE = '''FROM {image}
 
-            # Create directories only when we're about to use them
-            self.create_directory(pages_path)   # Creates parent directories too
+# Install system dependencies
+RUN apt-get update && apt-get install -y \\
+    {system_packages} \\
+    && rm -rf /var/lib/apt/lists/*
 
-            # Create project files
-            self._create_index_file(public_path)
-            self._create_bootstrap_file(src_path)
-            self._create_home_file(pages_path)
-            self._create_env_file(self.base_path)
-            self._create_gitignore(self.base_path)
+# Install PHP extensions
+RUN docker-php-ext-install pdo pdo_mysql mbstring zip exif \\
+    && docker-php-ext-configure gd \\
+    && docker-php-ext-install gd
 
-            return True
-        except Exception as e:
-            print(f"Error initializing vanilla PHP project: {e}")
-            return False
-        
-    def create_directory(self, path: Path) -> None:
-        """Create a directory if it doesn't exist."""
-        path.mkdir(exist_ok=True, parents=True)
-        
-    def _create_index_file(self, path: Path) -> None:
-        """Create the main index.php file."""
-        content = '''<?php
+# Configure PHP
+COPY docker/php/php.ini /usr/local/etc/php/conf.d/custom.ini
+COPY docker/php/www.conf /usr/local/etc/php-fpm.d/www.conf
+
+# Create log directory
+RUN mkdir -p /var/log/php-fpm \\
+    && chown -R www-data:www-data /var/log/php-fpm
+
+# Set proper permissions
+RUN usermod -u 1000 www-data \\
+    && groupmod -g 1000 www-data
+
+WORKDIR /var/www/html
+
+USER www-data'''
+
+_PHP_INI = b'''[PHP]
+; Error handling and logging
+display_errors = ${PHP_DISPLAY_ERRORS}
+display_startup_errors = ${PHP_DISPLAY_ERRORS}
+error_reporting = ${PHP_ERROR_REPORTING}
+log_errors = On
+error_log = /var/log/php-fpm/php_errors.log
+log_errors_max_len = 1024
+ignore_repeated_errors = Off
+ignore_repeated_source = Off
+report_memleaks = On
+track_errors = On
+
+; Resource limits
+memory_limit = ${PHP_MEMORY_LIMIT}
+max_execution_time = ${PHP_MAX_EXECUTION_TIME}
+post_max_size = ${PHP_POST_MAX_SIZE}
+upload_max_filesize = ${PHP_UPLOAD_MAX_FILESIZE}
+max_file_uploads = 20
+
+[Date]
+date.timezone = UTC
+
+[Session]
+session.save_handler = files
+session.save_path = /tmp
+session.gc_maxlifetime = 1800
+session.gc_probability = 1
+session.gc_divisor = 100
+
+[opcache]
+opcache.enable = 1
+opcache.memory_consumption = 128
+opcache.interned_strings_buffer = 8
+opcache.max_accelerated_files = 4000
+opcache.validate_timestamps = 1
+opcache.revalidate_freq = 0
+opcache.fast_shutdown = 1
+
+[mysqlnd]
+mysqlnd.collect_statistics = On
+mysqlnd.collect_memory_statistics = On'''
+
+_WWW_CONF = b"""[global]
+error_log = /var/log/php-fpm/error.log
+log_level = notice
+
+[www]
+user = www-data
+group = www-data
+
+listen = 9000
+listen.owner = www-data
+listen.group = www-data
+listen.mode = 0660
+
+pm = dynamic
+pm.max_children = 10
+pm.start_servers = 2
+pm.min_spare_servers = 1
+pm.max_spare_servers = 3
+pm.max_requests = 500
+
+php_admin_value[error_log] = /var/log/php-fpm/www-error.log
+php_admin_flag[log_errors] = on
+
+catch_workers_output = yes
+decorate_workers_output = yes
+
+env[DB_HOST] = $DB_HOST
+env[DB_DATABASE] = $DB_DATABASE
+env[DB_USERNAME] = $DB_USERNAME
+env[DB_PASSWORD] = $DB_PASSWORD
+
+security.limit_extensions = .php"""
+
+_NGINX_CONF = rb'''upstream php_fpm {
+    server php:9000;
+    keepalive 32;
+    keepalive_requests 1000;
+    keepalive_timeout 60s;
+}
+
+server {
+    listen 80;
+    server_name localhost;
+    root /var/www/html/public;
+    index index.php index.html;
+
+    # Security headers
+    add_header X-Frame-Options "SAMEORIGIN";
+    add_header X-XSS-Protection "1; mode=block";
+    add_header X-Content-Type-Options "nosniff";
+    add_header Referrer-Policy "strict-origin-when-cross-origin";
+
+    # Health check endpoint
+    location /ping {
+        access_log off;
+        return 200 'healthy\n';
+    }
+
+    location / {
+        try_files $uri $uri/ /index.php?$query_string;
+    }
+
+    location ~ \.php$ {
+        fastcgi_pass php_fpm;
+        fastcgi_keep_conn on;
+        fastcgi_index index.php;
+        fastcgi_param SCRIPT_FILENAME $document_root$fastcgi_script_name;
+        include fastcgi_params;
+
+        fastcgi_intercept_errors on;
+        fastcgi_buffer_size 32k;
+        fastcgi_buffers 64 32k;
+        fastcgi_busy_buffers_size 64k;
+        fastcgi_temp_file_write_size 64k;
+        fastcgi_max_temp_file_size 1024m;
+        fastcgi_connect_timeout 300;
+        fastcgi_send_timeout 300;
+        fastcgi_read_timeout 300;
+    }
+
+    location ~ /\.(?!well-known) {
+        deny all;
+        access_log off;
+        log_not_found off;
+    }
+
+    # Optimization for static files
+    location ~* \.(jpg|jpeg|png|gif|ico|css|js|svg|woff|woff2|ttf|eot)$ {
+        open_file_cache max=10000 inactive=60s;
+        open_file_cache_valid 10s;
+        open_file_cache_min_uses 2;
+        expires 30d;
+        access_log off;
+        add_header Cache-Control "public";
+    }
+}'''
+
+# Copied per instance; the nested values are immutable so the copies can share them
+_PHP_REQUIREMENTS = {
+    'image': 'php:8.2-fpm',
+    'system_packages': (
+        'git',
+        'zip',
+        'unzip',
+        'libpng-dev',
+        'libonig-dev',
+        'libzip-dev'
+    ),
+    'extensions': MappingProxyType({
+        'pdo': None,
+        'pdo_mysql': None,
+        'mbstring': None,
+        'zip': None,
+        'exif': None,
+        'gd': MappingProxyType({'configure': True})
+    })
+}
+
+# Static compose service skeletons, shallow-copied per call. The 'ports' slots are
+# overwritten per call, which keeps them in place in the emitted YAML.
+_PHP_SERVICE = {
+    'build': {
+        'context': '.',
+        'dockerfile': 'docker/php/Dockerfile'
+    },
+    'volumes': [
+        '.:/var/www/html:cached',
+        'php_logs:/var/log/php-fpm'
+    ],
+    'environment': {
+        'PHP_DISPLAY_ERRORS': '${PHP_DISPLAY_ERRORS}',
+        'PHP_ERROR_REPORTING': '${PHP_ERROR_REPORTING}',
+        'PHP_MEMORY_LIMIT': '${PHP_MEMORY_LIMIT}',
+        'PHP_MAX_EXECUTION_TIME': '${PHP_MAX_EXECUTION_TIME}',
+        'PHP_POST_MAX_SIZE': '${PHP_POST_MAX_SIZE}',
+        'PHP_UPLOAD_MAX_FILESIZE': '${PHP_UPLOAD_MAX_FILESIZE}'
+    },
+    'networks': ['app_network'],
+    'healthcheck': {
+        'test': ["CMD", "php-fpm", "-t"],
+        'interval': '10s',
+        'timeout': '5s',
+        'retries': 3
+    }
+}
+
+_NGINX_SERVICE = {
+    'image': 'nginx:alpine',
+    'ports': None,
+    'volumes': [
+        '.:/var/www/html:cached',
+        './docker/nginx/conf.d:/etc/nginx/conf.d:ro'
+    ],
+    'depends_on': ['php'],
+    'networks': ['app_network'],
+    'healthcheck': {
+        'test': ["CMD", "wget", "--quiet", "--tries=1", "--spider", "http://localhost/ping"],
+        # Same timing as NginxService.get_health_check()
+        'interval': '30s',
+        'timeout': '5s',
+        'retries': 3,
+        'start_period': '30s',
+        'start_interval': '1s'
+    }
+}
+
+_MYSQL_SERVICE = {
+    'image': 'mysql:8.0',
+    'environment': {
+        'MYSQL_DATABASE': '${DB_DATABASE}',
+        'MYSQL_USER': '${DB_USERNAME}',
+        'MYSQL_PASSWORD': '${DB_PASSWORD}',
+        'MYSQL_ROOT_PASSWORD': '${DB_ROOT_PASSWORD}'
+    },
+    'ports': None,
+    'volumes': ['mysql_data:/var/lib/mysql'],
+    'networks': ['app_network'],
+    'healthcheck': {
+        'test': ["CMD", "mysqladmin", "ping", "-h", "localhost"],
+        'interval': '10s',
+        'timeout': '5s',
+        'retries': 3
+    }
+}
+
+_INDEX_PHP = b'''<?php
 declare(strict_types=1);
 
 require_once __DIR__ . '/../src/bootstrap.php';
@@ -83,11 +291,8 @@ switch ($uri) {
         echo "404 Not Found";
         break;
 }'''
-        (path / 'index.php').write_text(content)
 
-    def _create_bootstrap_file(self, path: Path) -> None:
-        """Create the bootstrap.php file."""
-        content = '''<?php
+_BOOTSTRAP_PHP = b'''<?php
 declare(strict_types=1);
 
 // Error reporting for development
@@ -103,23 +308,27 @@ if (file_exists(__DIR__ . '/../.env')) {
     }
 }
 
-// Autoloader setup for future use
+// PSR-4 style autoloader
 spl_autoload_register(function ($class) {
-    $file = __DIR__ . '/' . str_replace('\\', '/', $class) . '.php';
+    // Convert namespace separators to directory separators
+    $file = __DIR__ . DIRECTORY_SEPARATOR . 
+            str_replace(['\\\\', '/'], DIRECTORY_SEPARATOR, $class) . '.php';
+    
     if (file_exists($file)) {
-        require $file;
+        require_once $file;
         return true;
     }
     return false;
-});'''
-        (path / 'bootstrap.php').write_text(content)
+});
 
-    def _create_home_file(self, path: Path) -> None:
-        """Create the home.php file."""
-        content = '''<?php
-declare(strict_types=1);
+// Register Composer autoloader if available
+$composerAutoloader = __DIR__ . '/../vendor/autoload.php';
+if (file_exists($composerAutoloader)) {
+    require_once $composerAutoloader;
+}'''
 
-$title = 'Welcome to ChimeraStack';
+_HOME_PHP = '''<?php
+declare(strict_types=1);
 ?>
 
 <!DOCTYPE html>
@@ -127,7 +336,7 @@ $title = 'Welcome to ChimeraStack';
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title><?= htmlspecialchars($title) ?></title>
+    <title>Welcome to ChimeraStack</title>
     <style>
         body {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
@@ -154,7 +363,7 @@ $title = 'Welcome to ChimeraStack';
     </style>
 </head>
 <body>
-    <h1><?= htmlspecialchars($title) ?></h1>
+    <h1>Welcome to ChimeraStack</h1>
     <p>Your development environment is ready.</p>
     <p><a href="/info">View PHP Info</a></p>
 
@@ -169,12 +378,9 @@ $title = 'Welcome to ChimeraStack';
     }
     ?>
 </body>
-</html>'''
-        (path / 'home.php').write_text(content)
+</html>'''.encode('utf-8')
 
-    def _create_env_file(self, path: Path) -> None:
-        """Create the .env file with default values."""
-        content = f'''# PHP Configuration
+_ENV_TEMPLATE = '''# PHP Configuration
 PHP_DISPLAY_ERRORS=1
 PHP_ERROR_REPORTING=E_ALL
 PHP_MEMORY_LIMIT=256M
@@ -186,15 +392,12 @@ PHP_UPLOAD_MAX_FILESIZE=100M
 DB_CONNECTION=mysql
 DB_HOST=mysql
 DB_PORT=3306
-DB_DATABASE={self.project_name}
-DB_USERNAME={self.project_name}
+DB_DATABASE={project_name}
+DB_USERNAME={project_name}
 DB_PASSWORD=secret
 DB_ROOT_PASSWORD=rootsecret'''
-        (path / '.env').write_text(content)
 
-    def _create_gitignore(self, path: Path) -> None:
-        """Create .gitignore file."""
-        content = '''# Environment files
+_GITIGNORE = b'''# Environment files
 .env
 *.env
 
@@ -209,240 +412,73 @@ DB_ROOT_PASSWORD=rootsecret'''
 # OS files
 .DS_Store
 Thumbs.db'''
-        (path / '.gitignore').write_text(content)
 
-    def setup_development_environment(self) -> bool:
-        """Set up development environment configurations."""
-        try:
-            # Only create php configuration directory when needed
-            php_path = self.base_path / 'docker' / 'php'
-            self.create_directory(php_path)
+class VanillaPHPFramework(BasePHPFramework):
+    # Read-only: shared by every instance
+    _DEFAULT_PORTS: Mapping[str, int] = MappingProxyType({'web': 8080, 'database': 3306})
 
-            # Create necessary configurations
-            self._create_php_dockerfile(php_path)
-            self._create_php_config(php_path)
-            self._create_php_fpm_config(php_path)
+    def __init__(self, project_name: str, base_path: Path):
+        super().__init__(project_name, base_path)
+        self.docker_requirements['php'] = dict(_PHP_REQUIREMENTS)
+
+    def initialize_project(self) -> bool:
+        """Initialize a minimal PHP project structure."""
+        try:
+            # Define and create only directories that will be used
+            base_path = os.fspath(self.base_path)
+            public_path = os.path.join(base_path, 'public')
+            src_path = os.path.join(base_path, 'src')
+            pages_path = os.path.join(src_path, 'pages')
+
+            # Write every project file in one batch; parent directories are
+            # created along the way
+            self._write_many([
+                (os.path.join(public_path, 'index.php'), _INDEX_PHP),
+                (os.path.join(src_path, 'bootstrap.php'), _BOOTSTRAP_PHP),
+                (os.path.join(pages_path, 'home.php'), _HOME_PHP),
+                (os.path.join(base_path, '.env'),
+                 render_template(_ENV_TEMPLATE, project_name=self.project_name)),
+                (os.path.join(base_path, '.gitignore'), _GITIGNORE)
+            ])
 
             return True
         except Exception as e:
-            print(f"Error setting up development environment: {e}")
+            _LOG.error("Error initializing vanilla PHP project: %s", e)
             return False
-
-    def _create_php_fpm_config(self, path: Path) -> None:
-        """Create PHP-FPM pool configuration."""
-        www_conf = """[global]
-error_log = /var/log/php-fpm/error.log
-log_level = notice
-
-[www]
-user = www-data
-group = www-data
-
-listen = 9000
-listen.owner = www-data
-listen.group = www-data
-listen.mode = 0660
-
-pm = dynamic
-pm.max_children = 10
-pm.start_servers = 2
-pm.min_spare_servers = 1
-pm.max_spare_servers = 3
-pm.max_requests = 500
-
-php_admin_value[error_log] = /var/log/php-fpm/www-error.log
-php_admin_flag[log_errors] = on
-
-catch_workers_output = yes
-decorate_workers_output = yes
-
-env[DB_HOST] = $DB_HOST
-env[DB_DATABASE] = $DB_DATABASE
-env[DB_USERNAME] = $DB_USERNAME
-env[DB_PASSWORD] = $DB_PASSWORD
-
-security.limit_extensions = .php"""
         
-        (path / 'www.conf').write_text(www_conf)
-
-    def _create_php_fpm_config(self, path: Path) -> None:
-        """Create PHP-FPM pool configuration."""
-        www_conf = """[global]
-error_log = /var/log/php-fpm/error.log
-log_level = notice
-
-[www]
-user = www-data
-group = www-data
-
-listen = 9000
-listen.owner = www-data
-listen.group = www-data
-listen.mode = 0660
-
-pm = dynamic
-pm.max_children = 10
-pm.start_servers = 2
-pm.min_spare_servers = 1
-pm.max_spare_servers = 3
-pm.max_requests = 500
-
-php_admin_value[error_log] = /var/log/php-fpm/www-error.log
-php_admin_flag[log_errors] = on
-
-catch_workers_output = yes
-decorate_workers_output = yes
-
-env[DB_HOST] = $DB_HOST
-env[DB_DATABASE] = $DB_DATABASE
-env[DB_USERNAME] = $DB_USERNAME
-env[DB_PASSWORD] = $DB_PASSWORD
-
-security.limit_extensions = .php"""
-        (path / 'www.conf').write_text(www_conf)
-
-    def _create_php_dockerfile(self, path: Path) -> None:
-        """Generate PHP Dockerfile."""
-        path.mkdir(exist_ok=True, parents=True)
-        content = f'''FROM {self.docker_requirements['php']['image']}
-
-# Install system dependencies
-RUN apt-get update && apt-get install -y \\
-    {" ".join(self.docker_requirements['php']['system_packages'])} \\
-    && rm -rf /var/lib/apt/lists/*
-
-# Install PHP extensions
-RUN docker-php-ext-install pdo pdo_mysql mbstring zip exif \\
-    && docker-php-ext-configure gd \\
-    && docker-php-ext-install gd
-
-# Configure PHP
-COPY docker/php/php.ini /usr/local/etc/php/conf.d/custom.ini
-COPY docker/php/www.conf /usr/local/etc/php-fpm.d/www.conf
-
-# Create log directory
-RUN mkdir -p /var/log/php-fpm \\
-    && chown -R www-data:www-data /var/log/php-fpm
-
-# Set proper permissions
-RUN usermod -u 1000 www-data \\
-    && groupmod -g 1000 www-data
-
-WORKDIR /var/www/html
-
-USER www-data'''
-        (path / 'Dockerfile').write_text(content)
-
-    def _create_php_config(self, path: Path) -> None:
-        """Generate PHP configuration."""
-        path.mkdir(exist_ok=True, parents=True)
-        content = '''[PHP]
-; Error handling and logging
-display_errors = ${PHP_DISPLAY_ERRORS}
-display_startup_errors = ${PHP_DISPLAY_ERRORS}
-error_reporting = ${PHP_ERROR_REPORTING}
-log_errors = On
-error_log = /var/log/php-fpm/php_errors.log
-log_errors_max_len = 1024
-ignore_repeated_errors = Off
-ignore_repeated_source = Off
-report_memleaks = On
-track_errors = On
-
-; Resource limits
-memory_limit = ${PHP_MEMORY_LIMIT}
-max_execution_time = ${PHP_MAX_EXECUTION_TIME}
-post_max_size = ${PHP_POST_MAX_SIZE}
-upload_max_filesize = ${PHP_UPLOAD_MAX_FILESIZE}
-max_file_uploads = 20
-
-[Date]
-date.timezone = UTC
-
-[Session]
-session.save_handler = files
-session.save_path = /tmp
-session.gc_maxlifetime = 1800
-session.gc_probability = 1
-session.gc_divisor = 100
+    def create_directory(self, path: str) -> None:
+        """Create a directory if it doesn't exist."""
+        os.makedirs(path, exist_ok=True)
+        
+    def setup_development_environment(self) -> bool:
+        """Set up development environment configurations."""
+        try:
+            # Write the PHP image configuration in one batch
+            php_path = os.path.join(os.fspath(self.base_path), 'docker', 'php')
+            self._write_many([
+                (os.path.join(php_path, 'Dockerfile'), self._render_php_dockerfile()),
+                (os.path.join(php_path, 'php.ini'), _PHP_INI),
+                (os.path.join(php_path, 'www.conf'), _WWW_CONF)
+            ])
 
-[opcache]
-opcache.enable = 1
-opcache.memory_consumption = 128
-opcache.interned_strings_buffer = 8
-opcache.max_accelerated_files = 4000
-opcache.validate_timestamps = 1
-opcache.revalidate_freq = 0
-opcache.fast_shutdown = 1
+            return True
+        except Exception as e:
+            _LOG.error("Error setting up development environment: %s", e)
+            return False
 
-[mysqlnd]
-mysqlnd.collect_statistics = On
-mysqlnd.collect_memory_statistics = On'''
-        (path / 'php.ini').write_text(content)
+    def _render_php_dockerfile(self) -> bytes:
+        """Render the PHP Dockerfile for the configured image and packages."""
+        php = self.docker_requirements['php']
+        return render_template(
+            _DOCKERFILE_TEMPLATE,
+            image=php['image'],
+            system_packages=' '.join(php['system_packages'])
+        )
 
-    def _create_nginx_config(self, path: Path) -> None:
+    def _create_nginx_config(self, path: str) -> None:
         """Create Nginx configuration."""
-        conf_d_path = path / 'conf.d'
-        conf_d_path.mkdir(exist_ok=True, parents=True)
-
-        content = r'''server {
-    listen 80;
-    server_name localhost;
-    root /var/www/html/public;
-    index index.php index.html;
-
-    # Security headers
-    add_header X-Frame-Options "SAMEORIGIN";
-    add_header X-XSS-Protection "1; mode=block";
-    add_header X-Content-Type-Options "nosniff";
-    add_header Referrer-Policy "strict-origin-when-cross-origin";
-
-    # Health check endpoint
-    location /ping {
-        access_log off;
-        return 200 'healthy\n';
-    }
-
-    location / {
-        try_files $uri $uri/ /index.php?$query_string;
-    }
-
-    location ~ \.php$ {
-        fastcgi_pass php:9000;
-        fastcgi_index index.php;
-        fastcgi_param SCRIPT_FILENAME $document_root$fastcgi_script_name;
-        include fastcgi_params;
+        self._write_many([(os.path.join(path, 'conf.d', 'default.conf'), _NGINX_CONF)])
 
-        fastcgi_intercept_errors on;
-        fastcgi_buffer_size 16k;
-        fastcgi_buffers 4 16k;
-        fastcgi_connect_timeout 300;
-        fastcgi_send_timeout 300;
-        fastcgi_read_timeout 300;
-    }
-
-    location ~ /\.(?!well-known) {
-        deny all;
-        access_log off;
-        log_not_found off;
-    }
-
-    # Optimization for static files
-    location ~* \.(jpg|jpeg|png|gif|ico|css|js|svg|woff|woff2|ttf|eot)$ {
-        expires 30d;
-        access_log off;
-        add_header Cache-Control "public";
-    }
-}'''
-        (conf_d_path / 'default.conf').write_text(content)
-
-    def get_default_ports(self) -> Dict[str, int]:
-        """Return default ports for vanilla PHP development."""
-        return {
-            'web': 8080,
-            'database': 3306
-        }
-    
     def get_service_volumes(self) -> Dict[str, Any]:
         """Get standardized volume configuration for all services."""
         return {
@@ -467,71 +503,17 @@ mysqlnd.collect_memory_statistics = On'''
 
     def get_php_service_config(self) -> Dict[str, Any]:
         """Get standardized PHP service configuration."""
-        return {
-            'build': {
-                'context': '.',
-                'dockerfile': 'docker/php/Dockerfile'
-            },
-            'volumes': [
-                '.:/var/www/html:cached',
-                'php_logs:/var/log/php-fpm'
-            ],
-            'environment': {
-                'PHP_DISPLAY_ERRORS': '${PHP_DISPLAY_ERRORS}',
-                'PHP_ERROR_REPORTING': '${PHP_ERROR_REPORTING}',
-                'PHP_MEMORY_LIMIT': '${PHP_MEMORY_LIMIT}',
-                'PHP_MAX_EXECUTION_TIME': '${PHP_MAX_EXECUTION_TIME}',
-                'PHP_POST_MAX_SIZE': '${PHP_POST_MAX_SIZE}',
-                'PHP_UPLOAD_MAX_FILESIZE': '${PHP_UPLOAD_MAX_FILESIZE}'
-            },
-            'networks': ['app_network'],
-            'healthcheck': {
-                'test': ["CMD", "php-fpm", "-t"],
-                'interval': '10s',
-                'timeout': '5s',
-                'retries': 3
-            }
-        }
+        return {**_PHP_SERVICE}
 
     def get_nginx_service_config(self) -> Dict[str, Any]:
         """Get standardized Nginx service configuration."""
-        return {
-            'image': 'nginx:alpine',
-            'ports': [f"{self.get_default_ports()['web']}:80"],
-            'volumes': [
-                '.:/var/www/html:cached',
-                './docker/nginx/conf.d:/etc/nginx/conf.d:ro'
-            ],
-            'depends_on': ['php'],
-            'networks': ['app_network'],
-            'healthcheck': {
-                'test': ["CMD", "wget", "--quiet", "--tries=1", "--spider", "http://localhost/ping"],
-                'interval': '10s',
-                'timeout': '5s',
-                'retries': 3
-            }
-        }
+        return {**_NGINX_SERVICE,
+                'ports': [f"{self.get_default_ports()['web']}:80"]}
 
     def get_mysql_service_config(self) -> Dict[str, Any]:
         """Get standardized MySQL service configuration."""
-        return {
-            'image': 'mysql:8.0',
-            'environment': {
-                'MYSQL_DATABASE': '${DB_DATABASE}',
-                'MYSQL_USER': '${DB_USERNAME}',
-                'MYSQL_PASSWORD': '${DB_PASSWORD}',
-                'MYSQL_ROOT_PASSWORD': '${DB_ROOT_PASSWORD}'
-            },
-            'ports': [f"{self.get_default_ports()['database']}:3306"],
-            'volumes': ['mysql_data:/var/lib/mysql'],
-            'networks': ['app_network'],
-            'healthcheck': {
-                'test': ["CMD", "mysqladmin", "ping", "-h", "localhost"],
-                'interval': '10s',
-                'timeout': '5s',
-                'retries': 3
-            }
-        }
+        return {**_MYSQL_SERVICE,
+                'ports': [f"{self.get_default_ports()['database']}:3306"]}
     
     def configure_docker(self) -> Dict[str, Any]:
         """Generate Docker configuration for vanilla PHP development."""
@@ -544,42 +526,4 @@ mysqlnd.collect_memory_statistics = On'''
             'networks': self.get_service_networks(),
             'volumes': self.get_service_volumes()
         }
-        return config
-
-    def _create_bootstrap_file(self, path: Path) -> None:
-        """Create the bootstrap.php file."""
-        content = '''<?php
-declare(strict_types=1);
-
-// Error reporting for development
-error_reporting(E_ALL);
-ini_set('display_errors', '1');
-
-// Load environment variables
-if (file_exists(__DIR__ . '/../.env')) {
-    $env = parse_ini_file(__DIR__ . '/../.env');
-    foreach ($env as $key => $value) {
-        $_ENV[$key] = $value;
-        putenv("$key=$value");
-    }
-}
-
-// PSR-4 style autoloader
-spl_autoload_register(function ($class) {
-    // Convert namespace separators to directory separators
-    $file = __DIR__ . DIRECTORY_SEPARATOR . 
-            str_replace(['\\\\', '/'], DIRECTORY_SEPARATOR, $class) . '.php';
-    
-    if (file_exists($file)) {
-        require_once $file;
-        return true;
-    }
-    return false;
-});
-
-// Register Composer autoloader if available
-$composerAutoloader = __DIR__ . '/../vendor/autoload.php';
-if (file_exists($composerAutoloader)) {
-    require_once $composerAutoloader;
-}'''
-        (path / 'bootstrap.php').write_text(content)
\ No newline at end of file
+        return config
\ No newline at end of file
@@ -5,12 +5,19 @@ Provides framework-specific implementations for Python projects including Django
 Flask, and vanilla Python configurations.
 """
 
-from .django import DjangoFramework
-from .flask import FlaskFramework
-from .vanilla import VanillaPythonFramework
+from chimera_stack.utils.lazy import lazy_exports
+
+# Submodule providing each public name, imported on first access (PEP 562)
+_LAZY = {
+    'DjangoFramework': '.django',
+    'FlaskFramework': '.flask',
+    'VanillaPythonFramework': '.vanilla'
+}
 
 __all__ = [
     'DjangoFramework',
     'FlaskFramework',
     'VanillaPythonFramework'
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(_LAZY, __name__)
\ No newline at end of file
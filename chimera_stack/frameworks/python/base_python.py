@@ -5,42 +5,84 @@ Provides common functionality for Python-based frameworks including virtual
 environment management and package handling.
 """
 
+import logging
+import os
 from pathlib import Path
-import subprocess
-import venv
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from chimera_stack.frameworks.base import BaseFramework
 
+_LOG = logging.getLogger(__name__)
+
+# Copied per instance before being emitted into docker-compose.yml (a plain
+# dict because PyYAML cannot represent MappingProxyType)
+_PYTHON_ENVIRONMENT = {
+    'PYTHONUNBUFFERED': '1',
+    'PYTHONDONTWRITEBYTECODE': '1'
+}
+
+# Copied per instance, together with its environment
+_PYTHON_REQUIREMENTS = {
+    'image': 'python:3.11-slim',
+    'environment': _PYTHON_ENVIRONMENT
+}
+
+_DOCKERFILE = b"""
+FROM python:3.11-slim
+
+WORKDIR /app
+
+ENV PYTHONUNBUFFERED=1 \\
+    PYTHONDONTWRITEBYTECODE=1 \\
+    PIP_NO_CACHE_DIR=1
+
+COPY requirements.txt .
+RUN pip install --no-cache-dir -r requirements.txt
+
+COPY . .
+""".strip()
+
 class BasePythonFramework(BaseFramework):
     """Base class for Python frameworks providing shared functionality."""
 
+    # Read-only: shared by every instance
+    _DEFAULT_PORTS: Mapping[str, int] = MappingProxyType({'web': 8000, 'database': 5432, 'cache': 6379})
+
     def __init__(self, project_name: str, base_path: Path):
         super().__init__(project_name, base_path)
         self.docker_requirements = {
-            'python': {
-                'image': 'python:3.11-slim',
-                'environment': {
-                    'PYTHONUNBUFFERED': '1',
-                    'PYTHONDONTWRITEBYTECODE': '1'
-                }
-            }
+            'python': {**_PYTHON_REQUIREMENTS, 'environment': dict(_PYTHON_ENVIRONMENT)}
         }
         self.venv_path = self.base_path / self.project_name / 'venv'
 
-    def get_default_ports(self) -> Dict[str, int]:
-        return {
-            'web': 8000,
-            'database': 5432,
-            'cache': 6379
-        }
+    def _ensure_tree(self, *relative: str) -> Path:
+        """
+        Create a directory under the project root, including parents.
+
+        Args:
+            relative: Path components below the project directory
+
+        Returns:
+            Path: The created (or existing) directory
+        """
+        path = self.base_path.joinpath(self.project_name, *relative)
+        self._ensure_dir(path)
+        return path
+
+    def get_default_ports(self) -> Mapping[str, int]:
+        """Return default host ports for development."""
+        return self._DEFAULT_PORTS
 
     def _setup_virtual_environment(self) -> bool:
         """Create and configure a Python virtual environment."""
+        import venv  # Deferred: heavy import only needed when a venv is built
+
         try:
-            venv.create(self.venv_path, with_pip=True)
+            # Symlink the interpreter instead of copying it where the OS allows
+            venv.create(self.venv_path, with_pip=True, symlinks=os.name != 'nt')
             return True
         except Exception as e:
-            print(f"Error creating virtual environment: {e}")
+            _LOG.error("Error creating virtual environment: %s", e)
             return False
 
     def configure_docker(self) -> Dict[str, Any]:
@@ -63,23 +105,9 @@ class BasePythonFramework(BaseFramework):
     def _generate_dockerfile(self) -> bool:
         """Generate a Dockerfile for the Python application."""
         try:
-            dockerfile_content = f"""
-FROM python:3.11-slim
-
-WORKDIR /app
-
-ENV PYTHONUNBUFFERED=1 \\
-    PYTHONDONTWRITEBYTECODE=1 \\
-    PIP_NO_CACHE_DIR=1
-
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-
-COPY . .
-"""
             dockerfile_path = self.base_path / self.project_name / 'Dockerfile'
-            dockerfile_path.write_text(dockerfile_content.strip())
+            dockerfile_path.write_bytes(_DOCKERFILE)
             return True
         except Exception as e:
-            print(f"Error generating Dockerfile: {e}")
+            _LOG.error("Error generating Dockerfile: %s", e)
             return False
\ No newline at end of file
@@ -7,99 +7,183 @@ on creating a production-ready Docker environment that aligns with Django's
 recommended deployment practices.
 """
 
+import logging
 from pathlib import Path
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 import subprocess
+from chimera_stack.frameworks.base import render_template
 from chimera_stack.frameworks.python.base_python import BasePythonFramework
 
+_LOG = logging.getLogger(__name__)
+
+_DOCKERFILE_TEMPLATE = """
+FROM {image}
+
+# Set working directory
+WORKDIR /app
+
+# Install system dependencies
+RUN apt-get update && apt-get install -y --no-install-recommends \\
+    build-essential \\
+    libpq-dev \\
+    && rm -rf /var/lib/apt/lists/*
+
+# Install Python dependencies
+COPY requirements.txt .
+RUN pip install --no-cache-dir -r requirements.txt
+
+# Create directory for static files
+RUN mkdir -p /app/staticfiles /app/media
+
+# Copy project
+COPY . .
+
+# Collect static files
+RUN python manage.py collectstatic --noinput
+
+# Run gunicorn
+CMD ["gunicorn", "--bind", "0.0.0.0:8000", "--workers", "4", "config.wsgi:application"]
+"""
+
+_REQUIREMENTS = b"""
+django>=4.2.0
+psycopg2-binary>=2.9.0
+gunicorn>=20.1.0
+python-dotenv>=1.0.0
+""".strip()
+
+_ENV_FILE = b'''
+DEBUG=1
+SECRET_KEY=your-secret-key-here
+DJANGO_SETTINGS_MODULE=config.settings
+POSTGRES_DB=postgres
+POSTGRES_USER=postgres
+POSTGRES_PASSWORD=postgres
+DATABASE_URL=postgresql://postgres:postgres@db:5432/postgres
+'''.strip()
+
+# Copied per instance before being emitted into docker-compose.yml
+_PYTHON_ENVIRONMENT = {
+    'DJANGO_SETTINGS_MODULE': 'config.settings',
+    'PYTHONUNBUFFERED': '1',
+    'DATABASE_URL': 'postgresql://postgres:postgres@db:5432/postgres'
+}
+
+# Copied per instance, together with its environment
+_PYTHON_REQUIREMENTS = {
+    'image': 'python:3.11-slim',
+    'environment': _PYTHON_ENVIRONMENT
+}
+
+# Static compose service skeletons, shallow-copied per call. The None slots are
+# overwritten per call, which keeps them in place in the emitted YAML.
+_WEB_SERVICE = {
+    'build': {
+        'context': '.',
+        'dockerfile': 'docker/python/Dockerfile'
+    },
+    'command': 'gunicorn config.wsgi:application --bind 0.0.0.0:8000',
+    'volumes': [
+        '.:/app:cached',
+        'static_volume:/app/staticfiles',
+        'media_volume:/app/media'
+    ],
+    'ports': None,
+    'environment': None,
+    'depends_on': ['db']
+}
+
+_DB_SERVICE = {
+    'image': 'postgres:13',
+    'volumes': ['postgres_data:/var/lib/postgresql/data/'],
+    'environment': {
+        'POSTGRES_DB': '${POSTGRES_DB}',
+        'POSTGRES_USER': '${POSTGRES_USER}',
+        'POSTGRES_PASSWORD': '${POSTGRES_PASSWORD}'
+    },
+    'ports': None
+}
+
+_VOLUMES = {
+    'postgres_data': None,
+    'static_volume': None,
+    'media_volume': None
+}
+
 class DjangoFramework(BasePythonFramework):
     """Django framework implementation focusing on Docker environment setup."""
 
+    # Read-only: shared by every instance
+    _DEFAULT_PORTS: Mapping[str, int] = MappingProxyType({'web': 8000, 'database': 5432})
+
     def __init__(self, project_name: str, base_path: Path):
         super().__init__(project_name, base_path)
-        self.docker_requirements.update({
-            'python': {
-                'image': 'python:3.11-slim',
-                'environment': {
-                    'DJANGO_SETTINGS_MODULE': 'config.settings',
-                    'PYTHONUNBUFFERED': '1',
-                    'DATABASE_URL': 'postgresql://postgres:postgres@db:5432/postgres'
-                }
-            }
-        })
+        self.docker_requirements['python'] = {
+            **_PYTHON_REQUIREMENTS, 'environment': dict(_PYTHON_ENVIRONMENT)
+        }
 
     def initialize_project(self) -> bool:
-        """Initialize a Django project using Docker."""
+        """Initialize a Django project, in-process when Django is installed."""
         try:
             project_path = self.base_path / self.project_name
-            
-            # Create project using Django's startproject through Docker
-            subprocess.run([
-                'docker', 'run', '--rm',
-                '-v', f'{self.base_path}:/app',
-                '-w', '/app',
-                self.docker_requirements['python']['image'],
-                'bash', '-c',
-                f'pip install django && django-admin startproject config {self.project_name}'
-            ], check=True)
+
+            if not self._start_project_in_process(project_path):
+                # Create project using Django's startproject through Docker
+                subprocess.run([
+                    'docker', 'run', '--rm',
+                    '-v', f'{self.base_path}:/app',
+                    '-w', '/app',
+                    # Throwaway container: skip pip's version check and wheel cache
+                    '-e', 'PIP_DISABLE_PIP_VERSION_CHECK=1',
+                    self.docker_requirements['python']['image'],
+                    'bash', '-c',
+                    f'pip install --no-cache-dir django && django-admin startproject config {self.project_name}'
+                ], check=True)
 
             # Create requirements.txt
-            requirements = [
-                'django>=4.2.0',
-                'psycopg2-binary>=2.9.0',
-                'gunicorn>=20.1.0',
-                'python-dotenv>=1.0.0'
-            ]
-            (project_path / 'requirements.txt').write_text('\n'.join(requirements))
+            (project_path / 'requirements.txt').write_bytes(_REQUIREMENTS)
             
             return True
         except subprocess.CalledProcessError as e:
-            print(f"Error initializing Django project: {e}")
+            _LOG.error("Error initializing Django project: %s", e)
+            return False
+
+    def _start_project_in_process(self, project_path: Path) -> bool:
+        """
+        Run startproject with the host's Django, skipping the container.
+
+        Args:
+            project_path: Directory to create the project in
+
+        Returns:
+            bool: True if the project was created, False if Django is not
+                installed or startproject failed
+        """
+        try:
+            from django.core.management import call_command
+            project_path.mkdir(parents=True, exist_ok=True)
+            call_command('startproject', 'config', str(project_path))
+            return True
+        except ImportError:
+            return False
+        except Exception as e:
+            _LOG.error("Error running startproject in-process: %s", e)
             return False
 
     def configure_docker(self) -> Dict[str, Any]:
         """Generate Django-specific Docker configuration."""
-        config = {
+        ports = self.get_default_ports()
+        return {
             'services': {
                 'web': {
-                    'build': {
-                        'context': '.',
-                        'dockerfile': 'docker/python/Dockerfile'
-                    },
-                    'command': 'gunicorn config.wsgi:application --bind 0.0.0.0:8000',
-                    'volumes': [
-                        '.:/app:cached',
-                        'static_volume:/app/staticfiles',
-                        'media_volume:/app/media'
-                    ],
-                    'ports': [f"{self.get_default_ports()['web']}:8000"],
-                    'environment': self.docker_requirements['python']['environment'],
-                    'depends_on': ['db']
+                    **_WEB_SERVICE,
+                    'ports': [f"{ports['web']}:8000"],
+                    'environment': self.docker_requirements['python']['environment']
                 },
-                'db': {
-                    'image': 'postgres:13',
-                    'volumes': ['postgres_data:/var/lib/postgresql/data/'],
-                    'environment': {
-                        'POSTGRES_DB': '${POSTGRES_DB}',
-                        'POSTGRES_USER': '${POSTGRES_USER}',
-                        'POSTGRES_PASSWORD': '${POSTGRES_PASSWORD}'
-                    },
-                    'ports': [f"{self.get_default_ports()['database']}:5432"]
-                }
+                'db': {**_DB_SERVICE, 'ports': [f"{ports['database']}:5432"]}
             },
-            'volumes': {
-                'postgres_data': None,
-                'static_volume': None,
-                'media_volume': None
-            }
-        }
-        return config
-
-    def get_default_ports(self) -> Dict[str, int]:
-        """Return default ports for Django development."""
-        return {
-            'web': 8000,
-            'database': 5432
+            'volumes': {**_VOLUMES}
         }
 
     def setup_development_environment(self) -> bool:
@@ -109,59 +193,19 @@ class DjangoFramework(BasePythonFramework):
             self._create_env_file()
             return True
         except Exception as e:
-            print(f"Error setting up Django environment: {e}")
+            _LOG.error("Error setting up Django environment: %s", e)
             return False
 
     def _create_docker_configs(self) -> None:
         """Create necessary Docker configuration files."""
-        docker_path = self.base_path / self.project_name / 'docker'
-        docker_path.mkdir(exist_ok=True)
-        
-        self._create_python_dockerfile(docker_path / 'python')
+        self._create_python_dockerfile(self._ensure_tree('docker', 'python'))
 
     def _create_python_dockerfile(self, path: Path) -> None:
         """Generate Python Dockerfile for Django."""
-        path.mkdir(exist_ok=True)
-        dockerfile_content = f"""
-FROM {self.docker_requirements['python']['image']}
-
-# Set working directory
-WORKDIR /app
-
-# Install system dependencies
-RUN apt-get update && apt-get install -y --no-install-recommends \\
-    build-essential \\
-    libpq-dev \\
-    && rm -rf /var/lib/apt/lists/*
-
-# Install Python dependencies
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-
-# Create directory for static files
-RUN mkdir -p /app/staticfiles /app/media
-
-# Copy project
-COPY . .
-
-# Collect static files
-RUN python manage.py collectstatic --noinput
-
-# Run gunicorn
-CMD ["gunicorn", "--bind", "0.0.0.0:8000", "--workers", "4", "config.wsgi:application"]
-"""
-        (path / 'Dockerfile').write_text(dockerfile_content.strip())
+        (path / 'Dockerfile').write_bytes(
+            render_template(_DOCKERFILE_TEMPLATE, image=self.docker_requirements['python']['image'])
+        )
 
     def _create_env_file(self) -> None:
         """Create .env file with development settings."""
-        env_content = '''
-DEBUG=1
-SECRET_KEY=your-secret-key-here
-DJANGO_SETTINGS_MODULE=config.settings
-POSTGRES_DB=postgres
-POSTGRES_USER=postgres
-POSTGRES_PASSWORD=postgres
-DATABASE_URL=postgresql://postgres:postgres@db:5432/postgres
-'''
-        env_path = self.base_path / self.project_name / '.env'
-        env_path.write_text(env_content.strip())
\ No newline at end of file
+        (self.base_path / self.project_name / '.env').write_bytes(_ENV_FILE)
\ No newline at end of file
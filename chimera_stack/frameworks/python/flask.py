@@ -6,43 +6,63 @@ and flexibility. This implementation focuses on creating a production-ready
 Docker environment without imposing specific project structure decisions.
 """
 
+import logging
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any
-import subprocess
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+from chimera_stack.frameworks.base import render_template
 from chimera_stack.frameworks.python.base_python import BasePythonFramework
 
-class FlaskFramework(BasePythonFramework):
-    """Flask framework implementation focusing on Docker environment setup."""
+_LOG = logging.getLogger(__name__)
 
-    def __init__(self, project_name: str, base_path: Path):
-        super().__init__(project_name, base_path)
-        self.docker_requirements.update({
-            'python': {
-                'image': 'python:3.11-slim',
-                'environment': {
-                    'FLASK_APP': 'app',
-                    'FLASK_ENV': 'development',
-                    'PYTHONUNBUFFERED': '1',
-                }
-            }
-        })
+_DOCKERFILE_TEMPLATE = """
+FROM {image}
 
-    def initialize_project(self) -> bool:
-        """Initialize a minimal Flask project using pip."""
-        try:
-            project_path = self.base_path / self.project_name
-            project_path.mkdir(exist_ok=True)
-            
-            # Create requirements.txt
-            requirements = [
-                'flask>=2.0.0',
-                'python-dotenv>=1.0.0',
-                'gunicorn>=20.1.0'
-            ]
-            (project_path / 'requirements.txt').write_text('\n'.join(requirements))
-            
-            # Create minimal app.py
-            app_content = '''
+WORKDIR /app
+
+# Install system dependencies
+RUN apt-get update && apt-get install -y --no-install-recommends \\
+    gcc \\
+    && rm -rf /var/lib/apt/lists/*
+
+# Install Python dependencies
+COPY requirements.txt .
+RUN pip install --no-cache-dir -r requirements.txt
+
+# Copy application
+COPY . .
+
+# Run with gunicorn
+CMD ["gunicorn", "--bind", "0.0.0.0:5000", "--workers", "4", "app:app"]
+"""
+
+_ENV_FILE = b'''
+FLASK_APP=app
+FLASK_ENV=development
+FLASK_DEBUG=1
+'''.strip()
+
+# Copied per instance before being emitted into docker-compose.yml
+_PYTHON_ENVIRONMENT = {
+    'FLASK_APP': 'app',
+    'FLASK_ENV': 'development',
+    'PYTHONUNBUFFERED': '1',
+}
+
+# Copied per instance, together with its environment
+_PYTHON_REQUIREMENTS = {
+    'image': 'python:3.11-slim',
+    'environment': _PYTHON_ENVIRONMENT
+}
+
+_REQUIREMENTS = b"""
+flask>=2.0.0
+python-dotenv>=1.0.0
+gunicorn>=20.1.0
+""".strip()
+
+_APP_MODULE = b'''
 from flask import Flask
 
 app = Flask(__name__)
@@ -53,49 +73,77 @@ def index():
 
 if __name__ == '__main__':
     app.run(host='0.0.0.0', debug=True)
-'''
-            (project_path / 'app.py').write_text(app_content.strip())
+'''.strip()
+
+# Static compose service skeletons, shallow-copied per call. The None slots are
+# overwritten per call, which keeps them in place in the emitted YAML.
+_WEB_SERVICE = {
+    'build': {
+        'context': '.',
+        'dockerfile': 'docker/python/Dockerfile'
+    },
+    'ports': None,
+    'volumes': [
+        '.:/app:cached'
+    ],
+    'environment': None,
+    'depends_on': None
+}
+
+_REDIS_SERVICE = {
+    'image': 'redis:alpine',
+    'ports': None
+}
+
+class FlaskFramework(BasePythonFramework):
+    """Flask framework implementation focusing on Docker environment setup."""
+
+    # Read-only: shared by every instance
+    _DEFAULT_PORTS: Mapping[str, int] = MappingProxyType({'web': 5000, 'cache': 6379})
+
+    def __init__(self, project_name: str, base_path: Path):
+        super().__init__(project_name, base_path)
+        self.docker_requirements['python'] = {
+            **_PYTHON_REQUIREMENTS, 'environment': dict(_PYTHON_ENVIRONMENT)
+        }
+
+    def initialize_project(self) -> bool:
+        """Initialize a minimal Flask project using pip."""
+        try:
+            project_path = self.base_path / self.project_name
+
+            # Write requirements.txt and a minimal app.py in one batch
+            self._write_many([
+                (project_path / 'requirements.txt', _REQUIREMENTS),
+                (project_path / 'app.py', _APP_MODULE)
+            ])
             
             return True
         except Exception as e:
-            print(f"Error initializing Flask project: {e}")
+            _LOG.error("Error initializing Flask project: %s", e)
             return False
 
     def configure_docker(self) -> Dict[str, Any]:
         """Generate Flask-specific Docker configuration."""
+        ports = self.get_default_ports()
+        uses_redis = self._uses_redis
         config = {
             'services': {
                 'web': {
-                    'build': {
-                        'context': '.',
-                        'dockerfile': 'docker/python/Dockerfile'
-                    },
-                    'ports': [f"{self.get_default_ports()['web']}:5000"],
-                    'volumes': [
-                        '.:/app:cached'
-                    ],
+                    **_WEB_SERVICE,
+                    'ports': [f"{ports['web']}:5000"],
                     'environment': self.docker_requirements['python']['environment'],
-                    'depends_on': ['redis'] if self._uses_redis() else []
+                    'depends_on': ['redis'] if uses_redis else []
                 }
             }
         }
 
         # Add Redis if specified
-        if self._uses_redis():
-            config['services']['redis'] = {
-                'image': 'redis:alpine',
-                'ports': [f"{self.get_default_ports()['cache']}:6379"]
-            }
+        if uses_redis:
+            config['services']['redis'] = {**_REDIS_SERVICE, 'ports': [f"{ports['cache']}:6379"]}
 
         return config
 
-    def get_default_ports(self) -> Dict[str, int]:
-        """Return default ports for Flask development."""
-        return {
-            'web': 5000,
-            'cache': 6379
-        }
-
     def setup_development_environment(self) -> bool:
         """Set up Flask development environment configurations."""
         try:
@@ -103,52 +151,28 @@ if __name__ == '__main__':
             self._create_env_file()
             return True
         except Exception as e:
-            print(f"Error setting up Flask environment: {e}")
+            _LOG.error("Error setting up Flask environment: %s", e)
             return False
 
     def _create_docker_configs(self) -> None:
         """Create necessary Docker configuration files."""
-        docker_path = self.base_path / self.project_name / 'docker'
-        docker_path.mkdir(exist_ok=True)
-        
-        self._create_python_dockerfile(docker_path / 'python')
+        self._create_python_dockerfile(self._ensure_tree('docker', 'python'))
 
     def _create_python_dockerfile(self, path: Path) -> None:
         """Generate Python Dockerfile for Flask."""
-        path.mkdir(exist_ok=True)
-        dockerfile_content = f"""
-FROM {self.docker_requirements['python']['image']}
-
-WORKDIR /app
-
-# Install system dependencies
-RUN apt-get update && apt-get install -y --no-install-recommends \\
-    gcc \\
-    && rm -rf /var/lib/apt/lists/*
-
-# Install Python dependencies
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-
-# Copy application
-COPY . .
-
-# Run with gunicorn
-CMD ["gunicorn", "--bind", "0.0.0.0:5000", "--workers", "4", "app:app"]
-"""
-        (path / 'Dockerfile').write_text(dockerfile_content.strip())
+        (path / 'Dockerfile').write_bytes(
+            render_template(_DOCKERFILE_TEMPLATE, image=self.docker_requirements['python']['image'])
+        )
 
     def _create_env_file(self) -> None:
         """Create .env file with development settings."""
-        env_content = '''
-FLASK_APP=app
-FLASK_ENV=development
-FLASK_DEBUG=1
-'''
-        env_path = self.base_path / self.project_name / '.env'
-        env_path.write_text(env_content.strip())
+        (self.base_path / self.project_name / '.env').write_bytes(_ENV_FILE)
 
+    @cached_property
     def _uses_redis(self) -> bool:
-        """Check if the project uses Redis."""
+        """Check if the project uses Redis, reading requirements.txt once."""
         requirements_path = self.base_path / self.project_name / 'requirements.txt'
-        return requirements_path.exists() and 'redis' in requirements_path.read_text()
\ No newline at end of file
+        try:
+            return b'redis' in requirements_path.read_bytes()
+        except FileNotFoundError:
+            return False
\ No newline at end of file
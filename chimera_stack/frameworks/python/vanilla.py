@@ -8,23 +8,44 @@ without framework constraints. This implementation focuses on creating a reliabl
 production-ready setup for custom Python development projects.
 """
 
+import logging
 from pathlib import Path
 from typing import Dict, Any
+from chimera_stack.frameworks.base import render_template
 from chimera_stack.frameworks.python.base_python import BasePythonFramework
 
-class VanillaPythonFramework(BasePythonFramework):
-    def initialize_project(self) -> bool:
-        try:
-            project_path = self.base_path / self.project_name
-            
-            # Create project structure
-            src_path = project_path / 'src'
-            tests_path = project_path / 'tests'
-            for path in [src_path, tests_path]:
-                path.mkdir(exist_ok=True, parents=True)
-            
-            # Create main application module
-            app_content = '''"""
+_LOG = logging.getLogger(__name__)
+
+_DOCKERFILE_TEMPLATE = """
+FROM {image}
+
+# Set working directory
+WORKDIR /app
+
+# Install system dependencies and development tools
+RUN apt-get update && apt-get install -y --no-install-recommends \\
+    build-essential \\
+    curl \\
+    git \\
+    && rm -rf /var/lib/apt/lists/*
+
+# Install Python dependencies
+COPY requirements.txt .
+RUN pip install --no-cache-dir -r requirements.txt
+
+# Copy application
+COPY . .
+
+# Set Python path and environment
+ENV PYTHONPATH=/app
+ENV PYTHONDONTWRITEBYTECODE=1
+ENV PYTHONUNBUFFERED=1
+
+# Run with gunicorn
+CMD ["gunicorn", "--bind", "0.0.0.0:8000", "--workers", "4", "--reload", "src.app:create_app()"]
+"""
+
+_APP_MODULE = b'''"""
 Application entry point.
 
 This module provides a basic WSGI application structure that can be extended
@@ -93,22 +114,18 @@ if __name__ == '__main__':
         print(f'Serving on port {port}...')
         httpd.serve_forever()
 '''
-            (src_path / 'app.py').write_text(app_content)
-            
-            # Create requirements.txt with development tools
-            requirements = [
-                'gunicorn>=20.1.0',
-                'python-dotenv>=1.0.0',
-                'pytest>=7.0.0',
-                'pytest-cov>=4.0.0',
-                'black>=22.0.0',
-                'isort>=5.0.0',
-                'pylint>=2.0.0'
-            ]
-            (project_path / 'requirements.txt').write_text('\n'.join(requirements))
-            
-            # Create basic test
-            test_content = '''"""Basic application tests."""
+
+_REQUIREMENTS = b"""
+gunicorn>=20.1.0
+python-dotenv>=1.0.0
+pytest>=7.0.0
+pytest-cov>=4.0.0
+black>=22.0.0
+isort>=5.0.0
+pylint>=2.0.0
+""".strip()
+
+_TEST_MODULE = b'''"""Basic application tests."""
 import json
 from src.app import create_app
 
@@ -141,43 +158,28 @@ def test_health_check():
     
     assert response_data['status'] == 'healthy'
 '''
-            (tests_path / 'test_app.py').write_text(test_content)
+
+class VanillaPythonFramework(BasePythonFramework):
+    def initialize_project(self) -> bool:
+        try:
+            project_path = self.base_path / self.project_name
+
+            # Write the starter application, requirements and tests in one
+            # batch; src/ and tests/ are created along the way
+            self._write_many([
+                (project_path / 'src' / 'app.py', _APP_MODULE),
+                (project_path / 'requirements.txt', _REQUIREMENTS),
+                (project_path / 'tests' / 'test_app.py', _TEST_MODULE)
+            ])
             
             return True
             
         except Exception as e:
-            print(f"Error initializing vanilla Python project: {e}")
+            _LOG.error("Error initializing vanilla Python project: %s", e)
             return False
 
     def _create_python_dockerfile(self, path: Path) -> None:
         """Generate enhanced Python Dockerfile."""
-        path.mkdir(exist_ok=True)
-        dockerfile_content = f"""
-FROM {self.docker_requirements['python']['image']}
-
-# Set working directory
-WORKDIR /app
-
-# Install system dependencies and development tools
-RUN apt-get update && apt-get install -y --no-install-recommends \\
-    build-essential \\
-    curl \\
-    git \\
-    && rm -rf /var/lib/apt/lists/*
-
-# Install Python dependencies
-COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
-
-# Copy application
-COPY . .
-
-# Set Python path and environment
-ENV PYTHONPATH=/app
-ENV PYTHONDONTWRITEBYTECODE=1
-ENV PYTHONUNBUFFERED=1
-
-# Run with gunicorn
-CMD ["gunicorn", "--bind", "0.0.0.0:8000", "--workers", "4", "--reload", "src.app:create_app()"]
-"""
-        (path / 'Dockerfile').write_text(dockerfile_content.strip())
\ No newline at end of file
+        (path / 'Dockerfile').write_bytes(
+            render_template(_DOCKERFILE_TEMPLATE, image=self.docker_requirements['python']['image'])
+        )
\ No newline at end of file
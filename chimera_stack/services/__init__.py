@@ -5,8 +5,16 @@ Service Implementations
 Provides configurations for various services like databases and web servers.
 """
 
-from .databases import MySQLService, PostgreSQLService, MariaDBService
-from .webservers import NginxService, ApacheService
+from chimera_stack.utils.lazy import lazy_exports
+
+# Submodule providing each public name, imported on first access (PEP 562)
+_LAZY = {
+    'MySQLService': '.databases',
+    'PostgreSQLService': '.databases',
+    'MariaDBService': '.databases',
+    'NginxService': '.webservers',
+    'ApacheService': '.webservers'
+}
 
 __all__ = [
     'MySQLService',
@@ -14,4 +22,6 @@ __all__ = [
     'MariaDBService',
     'NginxService',
     'ApacheService'
-]
\ No newline at end of file
+]
+
+__getattr__, __dir__ = lazy_exports(_LAZY, __name__)
\ No newline at end of file
@@ -5,8 +5,15 @@ Database Service Implementations
 Provides specialized configurations for different database systems.
 """
 
-from .mysql import MySQLService
-from .postgresql import PostgreSQLService
-from .mariadb import MariaDBService
+from chimera_stack.utils.lazy import lazy_exports
 
-__all__ = ['MySQLService', 'PostgreSQLService', 'MariaDBService']
\ No newline at end of file
+# Submodule providing each public name, imported on first access (PEP 562)
+_LAZY = {
+    'MySQLService': '.mysql',
+    'PostgreSQLService': '.postgresql',
+    'MariaDBService': '.mariadb'
+}
+
+__all__ = ['MySQLService', 'PostgreSQLService', 'MariaDBService']
+
+__getattr__, __dir__ = lazy_exports(_LAZY, __name__)
\ No newline at end of file
@@ -0,0 +1,61 @@
+"""
+MySQL-Family Server Configuration Templates
+
+Provides the my.cnf content shared by the MySQL and MariaDB services, along with
+the settings specific to each server. Services assemble their file once at import.
+"""
+
+MYSQLD_COMMON = b"""[mysqld]
+# Character Set Configuration
+character-set-server = utf8mb4
+collation-server = utf8mb4_unicode_ci
+
+# Connection and Thread Settings
+max_connections = 100
+thread_cache_size = 8
+thread_stack = 256K
+
+# Buffer Pool Configuration
+innodb_buffer_pool_size = 256M
+innodb_log_file_size = 64M
+innodb_flush_method = O_DIRECT
+innodb_flush_log_at_trx_commit = 2
+
+# InnoDB Settings
+innodb_file_per_table = 1
+innodb_strict_mode = 1
+
+# Logging Configuration
+slow_query_log = 1
+long_query_time = 2
+"""
+
+MYSQL_SPECIFIC = b"""slow_query_log_file = /var/log/mysql/mysql-slow.log
+
+# MySQL Settings
+default-authentication-plugin = mysql_native_password
+innodb_buffer_pool_instances = 4
+
+# Temporary Table Settings
+tmp_table_size = 32M
+max_heap_table_size = 32M
+
+# General Settings
+max_allowed_packet = 64M
+sql_mode = STRICT_TRANS_TABLES,NO_ZERO_IN_DATE,NO_ZERO_DATE,ERROR_FOR_DIVISION_BY_ZERO,NO_ENGINE_SUBSTITUTION
+
+[mysql]
+default-character-set = utf8mb4
+
+[client]
+default-character-set = utf8mb4
+"""
+
+# The query cache was removed in MySQL 8.0, so only MariaDB enables it
+MARIADB_SPECIFIC = b"""slow_query_log_file = /var/log/mysql/mariadb-slow.log
+
+# Query Cache Configuration
+query_cache_type = 1
+query_cache_limit = 1M
+query_cache_size = 16M
+"""
@@ -5,20 +5,51 @@ Provides the foundation for all database service handlers, ensuring consistent
 configuration and management across different database systems.
 """
 
+import logging
+import os
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+from chimera_stack.services.ports import reserve_port
+from chimera_stack.utils.fs import ensure_dir, write_many
+
+_LOG = logging.getLogger(__name__)
 
 class BaseDatabase(ABC):
     """Abstract base class for database service implementations."""
 
+    # Short database name used in volume names; subclasses override this
+    _volume_slug: Optional[str] = None
+
     def __init__(self, project_name: str, base_path: Path):
         self.project_name = project_name
         self.base_path = base_path
         self.config: Dict[str, Any] = {}
+        self._ensured_dirs: Set[str] = set()
 
-    @abstractmethod
     def get_docker_config(self) -> Dict[str, Any]:
+        """Return Docker service configuration for the database.
+
+        The configuration (including the probed host port) is built once per
+        instance and shared between calls; callers must not mutate it.
+        Building it never touches the filesystem; configuration files are
+        written only by generate_server_config.
+        """
+        return self.docker_config
+
+    @cached_property
+    def docker_config(self) -> Dict[str, Any]:
+        """Docker service configuration, built on first access."""
+        return self._build_docker_config()
+
+    def invalidate_docker_config(self) -> None:
+        """Drop the cached Docker configuration so the next call rebuilds it."""
+        self.__dict__.pop('docker_config', None)
+
+    @abstractmethod
+    def _build_docker_config(self) -> Dict[str, Any]:
         """Generate Docker service configuration for the database."""
         pass
 
@@ -44,15 +75,33 @@ class BaseDatabase(ABC):
             bool: True if directory was created successfully
         """
         try:
-            # Only create directory if it's required or has content
-            if required or any(path.iterdir()) if path.exists() else required:
-                if not path.exists():
-                    path.mkdir(parents=True, exist_ok=True)
+            # Only create directory if it's required; an existing one is kept as-is
+            target = os.fspath(path)
+            if required and not os.path.exists(target):
+                os.makedirs(target, exist_ok=True)
             return True
         except Exception as e:
-            print(f"Error creating directory {path}: {e}")
+            _LOG.error("Error creating directory %s: %s", path, e)
             return False
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory (and parents) once per instance."""
+        ensure_dir(path, self._ensured_dirs)
+
+    def _write_many(self, files: List[Tuple[Path, bytes]]) -> None:
+        """
+        Write a batch of configuration files in a single pass.
+
+        Args:
+            files: (path, content) pairs to write
+        """
+        write_many(files, self._ensured_dirs)
+
+    def _get_available_port(self, start_port: int, end_port: int) -> int:
+        """Find an available port in the specified range."""
+        port = reserve_port(start_port, end_port)
+        return port if port is not None else start_port  # Fallback to default
+
     def get_volume_name(self, service_name: str = None) -> str:
         """Generate a consistent volume name for the database.
 
@@ -63,19 +112,39 @@ class BaseDatabase(ABC):
             str: Consistent volume name for the service
         """
         if not service_name:
-            service_name = self.__class__.__name__.lower().replace('service', '')
+            return self._default_volume_name
+        return f"{self.project_name}_{service_name}_data"
+
+    @cached_property
+    def _default_volume_name(self) -> str:
+        """Volume name derived from the database type, computed once per instance."""
+        service_name = (self._volume_slug
+                        or self.__class__.__name__.lower().replace('service', ''))
         return f"{self.project_name}_{service_name}_data"
 
     def get_data_volume_config(self, volume_name: Optional[str] = None) -> Dict[str, Any]:
         """Generate volume configuration for persistent data storage.
 
+        The configuration for the default volume is built once per instance
+        and shared between calls; callers must not mutate it.
+
         Args:
             volume_name: Optional volume name override.
 
         Returns:
             Dict[str, Any]: Volume configuration dictionary
         """
-        volume_name = volume_name or self.get_volume_name()
+        if not volume_name:
+            return self._default_data_volume_config
+        return self._build_data_volume_config(volume_name)
+
+    @cached_property
+    def _default_data_volume_config(self) -> Dict[str, Any]:
+        """Volume configuration for the default volume, built on first access."""
+        return self._build_data_volume_config(self.get_volume_name())
+
+    def _build_data_volume_config(self, volume_name: str) -> Dict[str, Any]:
+        """Build the volume configuration for a named data volume."""
         return {
             'volumes': {
                 volume_name: {
@@ -9,10 +9,73 @@ optimizations and features for development environments.
 from pathlib import Path
 from typing import Dict, Any
 from .base import BaseDatabase
+from ._cnf_templates import MYSQLD_COMMON, MARIADB_SPECIFIC
+
+_MARIADB_SERVER_CNF = MYSQLD_COMMON + MARIADB_SPECIFIC
+
+_MARIADB_INIT_SCRIPT = b"""
+#!/bin/bash
+set -e
+
+mysql -u root -p${MARIADB_ROOT_PASSWORD} <<-EOSQL
+    SET GLOBAL log_bin_trust_function_creators = 1;
+    SET GLOBAL max_allowed_packet = 64 * 1024 * 1024;
+    
+    # Create additional databases if needed
+    # CREATE DATABASE IF NOT EXISTS test_db;
+    # GRANT ALL ON test_db.* TO '${MARIADB_USER}'@'%';
+    
+    FLUSH PRIVILEGES;
+EOSQL
+""".strip()
+
+_ENVIRONMENT_VARIABLES = {
+    'MARIADB_DATABASE': '${DB_NAME}',
+    'MARIADB_USER': '${DB_USER}',
+    'MARIADB_PASSWORD': '${DB_PASSWORD}',
+    'MARIADB_ROOT_PASSWORD': '${DB_ROOT_PASSWORD}',
+    'TZ': 'UTC'
+}
+
+_HEALTH_CHECK = {
+    'test': ['CMD', 'healthcheck.sh', '--connect', '--innodb_initialized'],
+    'interval': '10s',
+    'timeout': '5s',
+    'retries': 3,
+    'start_period': '30s',
+    'start_interval': '1s'
+}
+
+_BACKUP_CONFIG = {
+    'services': {
+        'mariadb-backup': {
+            'image': 'mariadb:10.11',
+            'command': '/backup.sh',
+            'volumes': [
+                './backups:/backups',
+                './docker/mariadb/scripts/backup.sh:/backup.sh:ro'
+            ],
+            'environment': {
+                'MARIADB_HOST': 'mariadb',
+                'MARIADB_DATABASE': '${DB_NAME}',
+                'MARIADB_USER': '${DB_USER}',
+                'MARIADB_PASSWORD': '${DB_PASSWORD}',
+                'BACKUP_KEEP_DAYS': '7',
+                'BACKUP_KEEP_WEEKS': '4',
+                'BACKUP_KEEP_MONTHS': '6'
+            },
+            'depends_on': ['mariadb']
+        }
+    }
+}
 
 class MariaDBService(BaseDatabase):
     """MariaDB database service implementation."""
 
+    DEFAULT_PORT = 3306
+
+    _volume_slug = 'mariadb'
+
     def __init__(self, project_name: str, base_path: Path):
         super().__init__(project_name, base_path)
         self.config.update({
@@ -21,7 +84,7 @@ class MariaDBService(BaseDatabase):
             'command': '--character-set-server=utf8mb4 --collation-server=utf8mb4_unicode_ci'
         })
 
-    def get_docker_config(self) -> Dict[str, Any]:
+    def _build_docker_config(self) -> Dict[str, Any]:
         """Generate Docker service configuration for MariaDB."""
         volume_name = f"{self.project_name}_mariadb_data"
         port = self._get_available_port(3306, 3400)  # Try ports between 3306 and 3400
@@ -47,41 +110,17 @@ class MariaDBService(BaseDatabase):
 
         return config
 
-    def _get_available_port(self, start_port: int, end_port: int) -> int:
-        """Find an available port in the specified range."""
-        import socket
-        for port in range(start_port, end_port + 1):
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                try:
-                    s.bind(('', port))
-                    return port
-                except OSError:
-                    continue
-        return start_port  # Fallback to default if no ports are available
-
     def get_default_port(self) -> int:
         """Return the default port for MariaDB."""
-        return 3306
+        return self.DEFAULT_PORT
 
     def get_environment_variables(self) -> Dict[str, str]:
         """Return required environment variables for MariaDB."""
-        return {
-            'MARIADB_DATABASE': '${DB_NAME}',
-            'MARIADB_USER': '${DB_USER}',
-            'MARIADB_PASSWORD': '${DB_PASSWORD}',
-            'MARIADB_ROOT_PASSWORD': '${DB_ROOT_PASSWORD}',
-            'TZ': 'UTC'
-        }
+        return _ENVIRONMENT_VARIABLES.copy()
 
     def get_health_check(self) -> Dict[str, Any]:
         """Generate health check configuration for MariaDB."""
-        return {
-            'test': ['CMD', 'healthcheck.sh', '--connect', '--innodb_initialized'],
-            'interval': '10s',
-            'timeout': '5s',
-            'retries': 3,
-            'start_period': '30s'
-        }
+        return _HEALTH_CHECK.copy()
 
     def generate_connection_string(self) -> str:
         """Generate a MariaDB connection string."""
@@ -90,89 +129,17 @@ class MariaDBService(BaseDatabase):
     def _create_mariadb_config(self) -> None:
         """Create MariaDB configuration files and initialization scripts."""
         config_path = self.base_path / self.project_name / 'docker' / 'mariadb'
-        config_path.mkdir(parents=True, exist_ok=True)
-
-        # Create configuration directory
-        conf_d_path = config_path / 'conf.d'
-        conf_d_path.mkdir(exist_ok=True)
-
-        # Create custom configuration
-        server_config = """
-[mysqld]
-# Performance Optimization
-innodb_buffer_pool_size = 256M
-innodb_log_file_size = 64M
-innodb_flush_log_at_trx_commit = 2
-innodb_flush_method = O_DIRECT
-
-# Connection and Thread Settings
-max_connections = 100
-thread_cache_size = 8
-thread_stack = 256K
-
-# Query Cache Configuration
-query_cache_type = 1
-query_cache_limit = 1M
-query_cache_size = 16M
-
-# Character Set Configuration
-character_set_server = utf8mb4
-collation_server = utf8mb4_unicode_ci
-
-# InnoDB Settings
-innodb_file_per_table = 1
-innodb_strict_mode = 1
-
-# Logging Configuration
-slow_query_log = 1
-slow_query_log_file = /var/log/mysql/mariadb-slow.log
-long_query_time = 2
-"""
-        (conf_d_path / 'server.cnf').write_text(server_config.strip())
-
-        # Create initialization directory
-        init_path = config_path / 'init'
-        init_path.mkdir(exist_ok=True)
-
-        # Create initialization script
-        init_script = """
-#!/bin/bash
-set -e
 
-mysql -u root -p${MARIADB_ROOT_PASSWORD} <<-EOSQL
-    SET GLOBAL log_bin_trust_function_creators = 1;
-    SET GLOBAL max_allowed_packet = 64 * 1024 * 1024;
-    
-    # Create additional databases if needed
-    # CREATE DATABASE IF NOT EXISTS test_db;
-    # GRANT ALL ON test_db.* TO '${MARIADB_USER}'@'%';
-    
-    FLUSH PRIVILEGES;
-EOSQL
-"""
-        (init_path / '01_init_db.sh').write_text(init_script.strip())
+        # Custom configuration and initialization script
+        self._write_many([
+            (config_path / 'conf.d' / 'server.cnf', _MARIADB_SERVER_CNF),
+            (config_path / 'init' / '01_init_db.sh', _MARIADB_INIT_SCRIPT)
+        ])
 
     def get_backup_config(self) -> Dict[str, Any]:
-        """Generate backup configuration for MariaDB."""
-        return {
-            'services': {
-                'mariadb-backup': {
-                    'image': 'mariadb:10.11',
-                    'command': '/backup.sh',
-                    'volumes': [
-                        './backups:/backups',
-                        './docker/mariadb/scripts/backup.sh:/backup.sh:ro'
-                    ],
-                    'environment': {
-                        'MARIADB_HOST': 'mariadb',
-                        'MARIADB_DATABASE': '${DB_NAME}',
-                        'MARIADB_USER': '${DB_USER}',
-                        'MARIADB_PASSWORD': '${DB_PASSWORD}',
-                        'BACKUP_KEEP_DAYS': '7',
-                        'BACKUP_KEEP_WEEKS': '4',
-                        'BACKUP_KEEP_MONTHS': '6'
-                    },
-                    'depends_on': ['mariadb']
-                }
-            }
-        }
\ No newline at end of file
+        """Generate backup configuration for MariaDB.
+
+        The returned mapping is shared by all instances and must be treated
+        as read-only.
+        """
+        return _BACKUP_CONFIG
\ No newline at end of file
@@ -10,9 +10,75 @@ from pathlib import Path
 from typing import Dict, Any
 from .base import BaseDatabase
 
+_ENVIRONMENT_VARIABLES = {
+    'POSTGRES_DB': '${DB_NAME}',
+    'POSTGRES_USER': '${DB_USER}',
+    'POSTGRES_PASSWORD': '${DB_PASSWORD}',
+    'POSTGRES_HOST_AUTH_METHOD': 'scram-sha-256',
+    'POSTGRES_INITDB_ARGS': '--auth-host=scram-sha-256'
+}
+
+_HEALTH_CHECK = {
+    'test': ['CMD-SHELL', 'pg_isready -U ${DB_USER} -d ${DB_NAME}'],
+    'interval': '10s',
+    'timeout': '5s',
+    'retries': 5,
+    'start_period': '30s'
+}
+
+_INIT_EXTENSIONS_SCRIPT = b"""
+#!/bin/bash
+set -e
+
+# Enable required extensions
+psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-EOSQL
+    CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+    CREATE EXTENSION IF NOT EXISTS "hstore";
+    CREATE EXTENSION IF NOT EXISTS "citext";
+EOSQL
+""".strip()
+
+_POSTGRESQL_CONF = b"""
+# Memory configuration
+shared_buffers = '128MB'
+effective_cache_size = '512MB'
+work_mem = '16MB'
+maintenance_work_mem = '128MB'
+
+# Query tuning
+random_page_cost = 1.1
+effective_io_concurrency = 200
+
+# Checkpoint configuration
+checkpoint_completion_target = 0.9
+max_wal_size = '2GB'
+min_wal_size = '1GB'
+
+# Connection settings
+listen_addresses = '*'
+max_connections = 100
+
+# Logging
+log_timezone = 'UTC'
+log_statement = 'none'
+log_min_duration_statement = 2000
+log_min_error_statement = 'error'
+""".strip()
+
+_PG_HBA_CONF = b"""
+# TYPE  DATABASE        USER            ADDRESS                 METHOD
+local   all            all                                     scram-sha-256
+host    all            all             0.0.0.0/0              scram-sha-256
+host    all            all             ::/0                    scram-sha-256
+""".strip()
+
 class PostgreSQLService(BaseDatabase):
     """PostgreSQL database service implementation."""
 
+    DEFAULT_PORT = 5432
+
+    _volume_slug = 'postgresql'
+
     def __init__(self, project_name: str, base_path: Path):
         super().__init__(project_name, base_path)
         self.config.update({
@@ -21,7 +87,7 @@ class PostgreSQLService(BaseDatabase):
             'shm_size': '256mb'  # Shared memory for better performance
         })
 
-    def get_docker_config(self) -> Dict[str, Any]:
+    def _build_docker_config(self) -> Dict[str, Any]:
         """Generate Docker service configuration for PostgreSQL."""
         volume_name = f"{self.project_name}_postgres_data"
         port = self._get_available_port(5432, 5500)  # Try ports between 5432 and 5500
@@ -46,41 +112,17 @@ class PostgreSQLService(BaseDatabase):
 
         return config
 
-    def _get_available_port(self, start_port: int, end_port: int) -> int:
-        """Find an available port in the specified range."""
-        import socket
-        for port in range(start_port, end_port + 1):
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                try:
-                    s.bind(('', port))
-                    return port
-                except OSError:
-                    continue
-        return start_port  # Fallback to default if no ports are available
-
     def get_default_port(self) -> int:
         """Return the default port for PostgreSQL."""
-        return 5432
+        return self.DEFAULT_PORT
 
     def get_environment_variables(self) -> Dict[str, str]:
         """Return required environment variables for PostgreSQL."""
-        return {
-            'POSTGRES_DB': '${DB_NAME}',
-            'POSTGRES_USER': '${DB_USER}',
-            'POSTGRES_PASSWORD': '${DB_PASSWORD}',
-            'POSTGRES_HOST_AUTH_METHOD': 'scram-sha-256',
-            'POSTGRES_INITDB_ARGS': '--auth-host=scram-sha-256'
-        }
+        return _ENVIRONMENT_VARIABLES.copy()
 
     def get_health_check(self) -> Dict[str, Any]:
         """Generate health check configuration for PostgreSQL."""
-        return {
-            'test': ['CMD-SHELL', 'pg_isready -U ${DB_USER} -d ${DB_NAME}'],
-            'interval': '10s',
-            'timeout': '5s',
-            'retries': 5,
-            'start_period': '30s'
-        }
+        return _HEALTH_CHECK.copy()
 
     def generate_connection_string(self) -> str:
         """Generate a PostgreSQL connection string."""
@@ -89,63 +131,13 @@ class PostgreSQLService(BaseDatabase):
     def _create_postgresql_config(self) -> None:
         """Create PostgreSQL configuration files and initialization scripts."""
         config_path = self.base_path / self.project_name / 'docker' / 'postgres'
-        config_path.mkdir(parents=True, exist_ok=True)
-        
-        # Create initialization directory
         init_path = config_path / 'init'
-        init_path.mkdir(exist_ok=True)
-
-        # Create initial setup script
-        init_script = """
-#!/bin/bash
-set -e
-
-# Enable required extensions
-psql -v ON_ERROR_STOP=1 --username "$POSTGRES_USER" --dbname "$POSTGRES_DB" <<-EOSQL
-    CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
-    CREATE EXTENSION IF NOT EXISTS "hstore";
-    CREATE EXTENSION IF NOT EXISTS "citext";
-EOSQL
-"""
-        (init_path / '01_init_extensions.sh').write_text(init_script.strip())
-
-        # Create PostgreSQL configuration
-        postgres_config = """
-# Memory configuration
-shared_buffers = '128MB'
-effective_cache_size = '512MB'
-work_mem = '16MB'
-maintenance_work_mem = '128MB'
-
-# Query tuning
-random_page_cost = 1.1
-effective_io_concurrency = 200
-
-# Checkpoint configuration
-checkpoint_completion_target = 0.9
-max_wal_size = '2GB'
-min_wal_size = '1GB'
-
-# Connection settings
-listen_addresses = '*'
-max_connections = 100
-
-# Logging
-log_timezone = 'UTC'
-log_statement = 'none'
-log_min_duration_statement = 2000
-log_min_error_statement = 'error'
-"""
-        (config_path / 'postgresql.conf').write_text(postgres_config.strip())
 
-        # Create access configuration
-        pg_hba_config = """
-# TYPE  DATABASE        USER            ADDRESS                 METHOD
-local   all            all                                     scram-sha-256
-host    all            all             0.0.0.0/0              scram-sha-256
-host    all            all             ::/0                    scram-sha-256
-"""
-        (config_path / 'pg_hba.conf').write_text(pg_hba_config.strip())
+        self._write_many([
+            (init_path / '01_init_extensions.sh', _INIT_EXTENSIONS_SCRIPT),
+            (config_path / 'postgresql.conf', _POSTGRESQL_CONF),
+            (config_path / 'pg_hba.conf', _PG_HBA_CONF)
+        ])
 
     def get_backup_config(self) -> Dict[str, Any]:
         """Generate backup configuration for PostgreSQL."""
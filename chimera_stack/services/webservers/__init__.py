@@ -5,7 +5,14 @@ Web Server Implementations
 Provides specialized configurations for different web servers.
 """
 
-from .nginx import NginxService
-from .apache import ApacheService
+from chimera_stack.utils.lazy import lazy_exports
 
-__all__ = ['NginxService', 'ApacheService']
\ No newline at end of file
+# Submodule providing each public name, imported on first access (PEP 562)
+_LAZY = {
+    'NginxService': '.nginx',
+    'ApacheService': '.apache'
+}
+
+__all__ = ['NginxService', 'ApacheService']
+
+__getattr__, __dir__ = lazy_exports(_LAZY, __name__)
\ No newline at end of file
@@ -7,121 +7,12 @@ with support for both PHP and Python applications, incorporating security
 best practices and performance optimizations.
 """
 
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, List
 from .base import BaseWebServer
 
-class ApacheService(BaseWebServer):
-    """Apache web server service implementation."""
-
-    def __init__(self, project_name: str, base_path: Path):
-        super().__init__(project_name, base_path)
-        self.config.update({
-            'image': 'httpd:2.4-alpine',
-            'restart': 'unless-stopped'
-        })
-
-    def get_docker_config(self) -> Dict[str, Any]:
-        """Generate Docker service configuration for Apache."""
-        http_port = self._get_available_port(8000, 8100)  # Try ports between 8000 and 8100
-        https_port = self._get_available_port(8443, 8543)  # Try ports between 8443 and 8543
-
-        config = {
-            'services': {
-                'apache': {
-                    **self.config,
-                    'ports': [
-                        f"{http_port}:80",
-                        f"{https_port}:443" if self.ssl_enabled else None
-                    ],
-                    'volumes': [
-                        '.:/var/www/html:cached',
-                        './docker/apache/conf/httpd.conf:/usr/local/apache2/conf/httpd.conf:ro',
-                        './docker/apache/conf/extra:/usr/local/apache2/conf/extra:ro',
-                        'apache_logs:/var/log/apache2'
-                    ],
-                    'environment': {
-                        'APACHE_RUN_USER': 'www-data',
-                        'APACHE_RUN_GROUP': 'www-data'
-                    },
-                    'depends_on': self._get_dependencies(),
-                    'healthcheck': self.get_health_check()
-                }
-            },
-            'volumes': {
-                'apache_logs': None
-            }
-        }
-
-        # Remove None values from ports list
-        config['services']['apache']['ports'] = [p for p in config['services']['apache']['ports'] if p is not None]
-
-        return config
-
-    def _get_available_port(self, start_port: int, end_port: int) -> int:
-        """Find an available port in the specified range."""
-        import socket
-        for port in range(start_port, end_port + 1):
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                try:
-                    s.bind(('', port))
-                    return port
-                except OSError:
-                    continue
-        return start_port  # Fallback to default if no ports are available
-
-    def get_default_port(self) -> int:
-        """Return the default port for Apache."""
-        return 8000
-
-    def get_health_check(self) -> Dict[str, Any]:
-        """Generate health check configuration for Apache."""
-        return {
-            'test': ['CMD', 'wget', '--quiet', '--tries=1', '--spider', 'http://localhost/server-status'],
-            'interval': '10s',
-            'timeout': '5s',
-            'retries': 3
-        }
-
-    def _get_dependencies(self) -> List[str]:
-        """Determine service dependencies based on project configuration."""
-        dependencies = []
-        if self._uses_php():
-            dependencies.append('php')
-        return dependencies
-
-    def _uses_php(self) -> bool:
-        """Determine if the project uses PHP."""
-        return True  # For now, always return True
-
-    def get_default_ports(self) -> Dict[str, int]:
-        """Return default ports for Apache development."""
-        return {
-            'http': 8000,
-            'https': 8443
-        }
-
-    def generate_server_config(self) -> None:
-        """Generate Apache configuration files."""
-        config_path = self.base_path / 'docker' / 'apache'
-        config_path.mkdir(parents=True, exist_ok=True)
-
-        # Create configuration directories
-        conf_path = config_path / 'conf'
-        conf_path.mkdir(exist_ok=True)
-
-        # Generate main configuration files
-        self._create_main_config(conf_path)
-        self._create_vhost_config(conf_path)
-        self._create_security_config(conf_path)
-        self._create_performance_config(conf_path)
-
-        if self.ssl_enabled:
-            self._create_ssl_config(conf_path)
-
-    def _create_main_config(self, config_path: Path) -> None:
-        """Create main Apache configuration."""
-        main_config = """
+_HTTPD_CONF = b"""
 ServerRoot "/usr/local/apache2"
 Listen 80
 
@@ -152,13 +43,10 @@ ServerName localhost
 DocumentRoot /var/www/html/public
 
 # Include additional configuration files
-IncludeOptional conf/extra/*.conf
-"""
-        (config_path / 'httpd.conf').write_text(main_config.strip())
+IncludeOptional conf/extra/local/*.conf
+""".strip()
 
-    def _create_vhost_config(self, config_path: Path) -> None:
-        """Create virtual host configuration."""
-        vhost_config = f"""
+_VHOST_CONF = b"""
 <VirtualHost *:80>
     ServerName localhost
     DocumentRoot /var/www/html/public
@@ -171,8 +59,8 @@ IncludeOptional conf/extra/*.conf
         # Enable .htaccess files
         <IfModule mod_rewrite.c>
             RewriteEngine On
-            RewriteCond %{{REQUEST_FILENAME}} !-d
-            RewriteCond %{{REQUEST_FILENAME}} !-f
+            RewriteCond %{REQUEST_FILENAME} !-d
+            RewriteCond %{REQUEST_FILENAME} !-f
             RewriteRule ^ index.php [L]
         </IfModule>
     </Directory>
@@ -186,12 +74,9 @@ IncludeOptional conf/extra/*.conf
     Header set X-Frame-Options "SAMEORIGIN"
     Header set X-XSS-Protection "1; mode=block"
 </VirtualHost>
-"""
-        (config_path / 'extra' / 'vhost.conf').write_text(vhost_config.strip())
+""".strip()
 
-    def _create_security_config(self, config_path: Path) -> None:
-        """Create security configuration."""
-        security_config = r"""
+_SECURITY_CONF = br"""
 # Server security configuration
 ServerTokens Prod
 ServerSignature Off
@@ -214,12 +99,9 @@ Options -Indexes
 
 # Enable HTTP Strict Transport Security
 Header always set Strict-Transport-Security "max-age=63072000"
-"""
-        (config_path / 'extra' / 'security.conf').write_text(security_config.strip())
+""".strip()
 
-    def _create_performance_config(self, config_path: Path) -> None:
-        """Create performance optimization configuration."""
-        performance_config = """
+_PERFORMANCE_CONF = b"""
 # MPM Configuration
 <IfModule mpm_event_module>
     StartServers             3
@@ -252,8 +134,88 @@ Header always set Strict-Transport-Security "max-age=63072000"
     ExpiresByType image/jpeg "access plus 1 year"
     ExpiresByType image/png "access plus 1 year"
 </IfModule>
-"""
-        (config_path / 'extra' / 'performance.conf').write_text(performance_config.strip())
+""".strip()
+
+# The bundled snippets are spliced into httpd.conf at generation time, in the
+# order IncludeOptional would have loaded them, so Apache reads one file at
+# startup. Only conf/extra/local is included, for user-supplied additions:
+# projects generated earlier still hold the old snippets in conf/extra, and
+# loading them again would duplicate the vhost and MPM directives.
+_SPLICED_HTTPD_CONF = _HTTPD_CONF.replace(
+    b'# Include additional configuration files',
+    b'\n\n'.join((_PERFORMANCE_CONF, _SECURITY_CONF, _VHOST_CONF))
+    + b'\n\n# Include additional configuration files'
+)
+
+# Shared by every call; treat as read-only
+_VOLUMES = [
+    '.:/var/www/html:cached',
+    './docker/apache/conf/httpd.conf:/usr/local/apache2/conf/httpd.conf:ro',
+    './docker/apache/conf/extra:/usr/local/apache2/conf/extra:ro',
+    'apache_logs:/var/log/apache2'
+]
+
+_ENVIRONMENT = {
+    'APACHE_RUN_USER': 'www-data',
+    'APACHE_RUN_GROUP': 'www-data'
+}
+
+_HEALTH_CHECK_TEST = ('CMD', 'wget', '--quiet', '--tries=1', '--spider', 'http://127.0.0.1/server-status')
+
+class ApacheService(BaseWebServer):
+    """Apache web server service implementation."""
+
+    DEFAULT_PORT = 8000
+
+    def __init__(self, project_name: str, base_path: Path):
+        super().__init__(project_name, base_path)
+        self.config.update({
+            'image': 'httpd:2.4-alpine',
+            'restart': 'unless-stopped'
+        })
+
+    def _build_docker_config(self) -> Dict[str, Any]:
+        """Generate Docker service configuration for Apache."""
+        # Try ports between 8000 and 8100, plus 8443-8543 only when serving TLS
+        ports = [f"{self._get_available_port(8000, 8100)}:80"]
+        if self.ssl_enabled:
+            ports.append(f"{self._get_available_port(8443, 8543)}:443")
+
+        return {
+            'services': {
+                'apache': {
+                    **self.config,
+                    'ports': ports,
+                    'volumes': _VOLUMES,
+                    'environment': _ENVIRONMENT,
+                    'depends_on': self._get_dependencies(),
+                    'healthcheck': self.get_health_check()
+                }
+            },
+            'volumes': {
+                'apache_logs': None
+            }
+        }
+
+    def get_default_port(self) -> int:
+        """Return the default port for Apache."""
+        return self.DEFAULT_PORT
+
+    def get_health_check(self) -> Dict[str, Any]:
+        """Generate health check configuration for Apache."""
+        return self._build_health_check(_HEALTH_CHECK_TEST)
+
+    def generate_server_config(self) -> None:
+        """Generate Apache configuration files."""
+        conf_path = self.base_path / 'docker' / 'apache' / 'conf'
+        local_path = conf_path / 'extra' / 'local'
+
+        # conf/extra is bind-mounted and local/ is included, so create both
+        self._ensure_dir(local_path)
+        self._write_many([(conf_path / 'httpd.conf', _SPLICED_HTTPD_CONF)])
+
+        if self.ssl_enabled:
+            self._create_ssl_config(conf_path)
 
     def _get_port_mappings(self) -> List[str]:
         """Generate port mappings for the service."""
@@ -264,20 +226,16 @@ Header always set Strict-Transport-Security "max-age=63072000"
 
     def _get_volume_mappings(self) -> List[str]:
         """Generate volume mappings for the service."""
-        return [
-            '.:/var/www/html:cached',
-            './docker/apache/conf/httpd.conf:/usr/local/apache2/conf/httpd.conf:ro',
-            './docker/apache/conf/extra:/usr/local/apache2/conf/extra:ro',
-            'apache_logs:/var/log/apache2'
-        ]
+        return list(_VOLUMES)
 
     def _get_dependencies(self) -> List[str]:
         """Determine service dependencies based on project configuration."""
         dependencies = []
-        if self._uses_php():
+        if self._uses_php:
             dependencies.append('php')
         return dependencies
 
+    @cached_property
     def _uses_php(self) -> bool:
         """Determine if the project uses PHP."""
         # This could be enhanced to check project configuration
@@ -6,22 +6,60 @@ ensuring consistent configuration and management across different web server
 implementations.
 """
 
+import logging
+import os
 from abc import ABC, abstractmethod
+from functools import cached_property
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Set, Tuple
+
+from chimera_stack.services.ports import release_ports, reserve_port
+from chimera_stack.utils.fs import ensure_dir, write_many
+
+_LOG = logging.getLogger(__name__)
 
 class BaseWebServer(ABC):
     """Abstract base class for web server implementations."""
 
+    # Healthcheck timing, overridable per subclass
+    HEALTHCHECK_INTERVAL = '10s'
+    HEALTHCHECK_TIMEOUT = '5s'
+    HEALTHCHECK_RETRIES = 3
+    HEALTHCHECK_START_PERIOD = '10s'
+
+    # Read-only: shared by every instance
+    _DEFAULT_PORTS: Mapping[str, int] = MappingProxyType({'http': 8000, 'https': 8443})
+
     def __init__(self, project_name: str, base_path: Path):
         self.project_name = project_name
         self.base_path = base_path
         self.config: Dict[str, Any] = {}
         self.ssl_enabled = False
         self._allocated_ports: List[int] = []
+        self._ensured_dirs: Set[str] = set()
 
-    @abstractmethod
     def get_docker_config(self) -> Dict[str, Any]:
+        """Return Docker service configuration for the web server.
+
+        The configuration (including the probed host ports) is built once per
+        instance and shared between calls; callers must not mutate it.
+        Building it never touches the filesystem; configuration files are
+        written only by generate_server_config.
+        """
+        return self.docker_config
+
+    @cached_property
+    def docker_config(self) -> Dict[str, Any]:
+        """Docker service configuration, built on first access."""
+        return self._build_docker_config()
+
+    def invalidate_docker_config(self) -> None:
+        """Drop the cached Docker configuration so the next call rebuilds it."""
+        self.__dict__.pop('docker_config', None)
+
+    @abstractmethod
+    def _build_docker_config(self) -> Dict[str, Any]:
         """Generate Docker service configuration for the web server."""
         pass
 
@@ -44,27 +82,59 @@ class BaseWebServer(ABC):
         try:
             # Only create directory if it's required or has content
             if required or any(path.iterdir()) if path.exists() else required:
-                if not path.exists():
-                    path.mkdir(parents=True, exist_ok=True)
+                os.makedirs(path, exist_ok=True)
             return True
         except Exception as e:
-            print(f"Error creating directory {path}: {e}")
+            _LOG.error("Error creating directory %s: %s", path, e)
             return False
 
+    def _ensure_dir(self, path: Path) -> None:
+        """Create a directory (and parents) once per instance."""
+        ensure_dir(path, self._ensured_dirs)
+
+    def _write_many(self, files: List[Tuple[Path, bytes]]) -> None:
+        """
+        Write a batch of configuration files in a single pass.
+
+        Args:
+            files: (path, content) pairs to write
+        """
+        write_many(files, self._ensured_dirs)
+
     def _get_available_port(self, start_port: int, end_port: int) -> int:
         """Find an available port in the specified range."""
-        import socket
-        for port in range(start_port, end_port + 1):
-            if port in self._allocated_ports:
-                continue
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                try:
-                    s.bind(('', port))
-                    self._allocated_ports.append(port)
-                    return port
-                except OSError:
-                    continue
-        return start_port  # Fallback to default if no ports are available
+        port = reserve_port(start_port, end_port)
+        if port is None:
+            return start_port  # Fallback to default if no ports are available
+        self._allocated_ports.append(port)
+        return port
+
+    def _build_health_check(self, test: Sequence[str]) -> Dict[str, Any]:
+        """
+        Build a health check for the given test command.
+
+        Probes run every second during the start period so the container
+        reports healthy quickly, then fall back to the regular interval.
+
+        Args:
+            test: Docker healthcheck test command, typically a shared
+                module-level tuple
+
+        Returns:
+            Dict[str, Any]: Health check configuration
+        """
+        return {
+            'test': list(test),
+            'interval': self.HEALTHCHECK_INTERVAL,
+            'timeout': self.HEALTHCHECK_TIMEOUT,
+            'retries': self.HEALTHCHECK_RETRIES,
+            'start_period': self.HEALTHCHECK_START_PERIOD,
+            'start_interval': '1s'
+        }
+
+    def get_default_ports(self) -> Mapping[str, int]:
+        """Return default host ports for web server development."""
+        return self._DEFAULT_PORTS
 
     def get_allocated_ports(self) -> List[int]:
         """Return list of ports allocated by this service."""
@@ -72,8 +142,12 @@ class BaseWebServer(ABC):
 
     def release_ports(self) -> None:
         """Release all allocated ports."""
+        release_ports(self._allocated_ports)
         self._allocated_ports.clear()
+        # The cached configuration publishes the ports just released
+        self.invalidate_docker_config()
 
+    @cached_property
     def _uses_php(self) -> bool:
         """Determine if the project uses PHP."""
         return False
\ No newline at end of file
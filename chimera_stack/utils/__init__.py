@@ -0,0 +1,5 @@
+"""
+ChimeraStack Utilities
+
+Small helpers shared across the core, framework and service packages.
+"""
\ No newline at end of file
@@ -0,0 +1,71 @@
+"""
+File Writing Helpers
+
+Provides the batched raw-byte writer shared by framework and service classes
+when generating project files.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterable, Set, Tuple, Union
+
+PathLike = Union[str, Path]
+
+# os.open descriptors are already non-inheritable (PEP 446), so no
+# O_CLOEXEC is needed to keep them out of spawned docker processes
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+
+def ensure_dir(path: PathLike, created: Set[str]) -> None:
+    """
+    Create a directory (and parents) unless it was already created.
+
+    Args:
+        path: Directory to create
+        created: Directories already created by the caller; updated in place
+    """
+    key = os.fspath(path)
+    if key not in created:
+        os.makedirs(key, exist_ok=True)
+        created.add(key)
+
+
+def write_many(files: Iterable[Tuple[PathLike, bytes]], created: Set[str]) -> None:
+    """
+    Write a batch of pre-encoded files in a single pass.
+
+    Each distinct parent directory is created once, and each file is written
+    with one raw open/write/close, bypassing the text layer. Files whose
+    contents are already up to date are left untouched so their mtime, and
+    any bind-mount watchers, are not disturbed.
+
+    Args:
+        files: (path, content) pairs to write
+        created: Directories already created by the caller; updated in place
+    """
+    files = [(os.fspath(path), data) for path, data in files]
+    for parent in dict.fromkeys(os.path.dirname(path) for path, _ in files):
+        ensure_dir(parent, created)
+
+    for path, data in files:
+        if _is_current(path, data):
+            continue
+        fd = os.open(path, _WRITE_FLAGS, 0o644)
+        try:
+            # os.write may write fewer bytes than asked; finish the rest
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
+
+def _is_current(path: str, data: bytes) -> bool:
+    """Check whether a file already holds exactly the given bytes."""
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, 'rb', buffering=0) as f:
+            return f.read(len(data) + 1) == data
+    except OSError:
+        return False
\ No newline at end of file
@@ -0,0 +1,39 @@
+"""
+Lazy Package Exports
+
+Provides the PEP 562 module hooks used by package __init__ files to import
+their public classes only on first access.
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, List, Mapping, Tuple
+
+
+def lazy_exports(
+    mapping: Mapping[str, str], module_name: str
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ hooks for lazy exports.
+
+    Each resolved name is stored on the module, so later lookups bypass
+    __getattr__ entirely.
+
+    Args:
+        mapping: Public name -> submodule (relative to module_name) providing it
+        module_name: __name__ of the package exporting the names
+
+    Returns:
+        Tuple[Callable, Callable]: The __getattr__ and __dir__ hooks
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in mapping:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(mapping[name], module_name), name)
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(mapping))
+
+    return __getattr__, __dir__
\ No newline at end of file